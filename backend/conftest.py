@@ -0,0 +1,136 @@
+"""
+Shared pytest fixtures for the backend test suite.
+"""
+
+import importlib
+import os
+import sys
+
+import pytest
+
+# Tests import app.py and its siblings as top-level modules, and app.py
+# imports the backend package. pytest runs with --import-mode=importlib,
+# which leaves sys.path alone, so add backend/ and the repo root once
+_BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+for _path in (os.path.dirname(_BACKEND_DIR), _BACKEND_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from testutils import database_url
+
+# Keep Hypothesis' example database on tmpfs where there is one. Set before
+# hypothesis is imported, which resolves the directory on first use
+if os.path.isdir("/dev/shm"):
+    os.environ.setdefault("HYPOTHESIS_STORAGE_DIRECTORY", "/dev/shm/picme-hyp")
+
+# Load app's slow dependencies once, up front. Tests that drop 'app' from
+# sys.modules and import it again then only re-execute app.py itself
+for _module_name in ('numpy', 'cv2', 'face_recognition', 'psycopg2'):
+    try:
+        importlib.import_module(_module_name)
+    except ImportError:
+        pass
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # Keep pytest's cache on tmpfs too, where there is one. Set before the
+    # cache provider reads cache_dir; an explicit -o cache_dir=... still wins
+    if os.path.isdir("/dev/shm"):
+        config.inicfg.setdefault("cache_dir", "/dev/shm/picme-pytest")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow", action="store_true", default=False,
+        help="run tests marked slow (e.g. the full Docker image build)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    run_slow = config.getoption("--run-slow")
+    # Tests marked serial touch the shared database; under xdist they are
+    # left for a second pass without workers: pytest -m serial -n0
+    in_xdist_worker = "PYTEST_XDIST_WORKER" in os.environ
+    skip_slow = pytest.mark.skip(reason="slow test, pass --run-slow to run it")
+    skip_serial = pytest.mark.skip(
+        reason="serial test, run it in a separate pass: pytest -m serial -n0"
+    )
+    for item in items:
+        if "slow" in item.keywords and not run_slow:
+            item.add_marker(skip_slow)
+        if "serial" in item.keywords and in_xdist_worker:
+            item.add_marker(skip_serial)
+
+
+@pytest.fixture(scope="session")
+def worker_tmp_dir(tmp_path_factory):
+    """
+    Temporary directory private to the current pytest-xdist worker.
+
+    Keyed by PYTEST_XDIST_WORKER so parallel workers never share upload
+    or processed folders ("gw0" when running without xdist).
+    """
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    return tmp_path_factory.mktemp(f"picme_{worker_id}")
+
+
+@pytest.fixture(scope="session")
+def db_conn():
+    """
+    One psycopg2 connection shared by the whole session, so the TLS
+    handshake and authentication to the database are paid only once.
+    """
+    psycopg2 = pytest.importorskip("psycopg2")
+    conn = psycopg2.connect(database_url())
+    yield conn
+    conn.close()
+
+
+@pytest.fixture(scope="module")
+def pg_pool():
+    """
+    Thread-safe psycopg2 connection pool for a test module.
+
+    Hypothesis examples check connections out with getconn()/putconn()
+    instead of opening a new one each time.
+    """
+    pool = pytest.importorskip("psycopg2.pool")
+    pg_pool = pool.ThreadedConnectionPool(1, 8, database_url())
+    yield pg_pool
+    pg_pool.closeall()
+
+
+@pytest.fixture(scope="module")
+def shared_cursor(pg_pool):
+    """
+    Plain cursor on one pooled connection, reused by every test and
+    Hypothesis example in a module.
+
+    The connection is in autocommit mode so examples don't accumulate
+    transaction state; it is switched back before returning to the pool.
+    """
+    conn = pg_pool.getconn()
+    conn.autocommit = True
+    cursor = conn.cursor()
+    yield cursor
+    cursor.close()
+    conn.autocommit = False
+    pg_pool.putconn(conn)
+
+
+@pytest.fixture
+def db_cursor(db_conn):
+    """
+    RealDictCursor on the shared connection, in a fresh transaction.
+
+    Anything the test leaves uncommitted is rolled back afterwards, so
+    inserts clean themselves up without another round-trip per row.
+    """
+    import psycopg2.extras
+
+    db_conn.rollback()
+    cursor = db_conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+    yield cursor
+    cursor.close()
+    db_conn.rollback()
@@ -10,41 +10,65 @@ by testing the Flask application directly.
 import pytest
 import os
 import sys
-import json
-import tempfile
+import uuid
 from io import BytesIO
 
 # Add backend to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Import Flask app
+# Import Flask app. Bind the module now: test_config.py re-imports app, and
+# a later "import app" would return a module that isn't serving these routes
+import app as app_module
 from app import app as flask_app
+from testutils import loads
 
 
 # ============================================================================
 # Test Setup and Fixtures
 # ============================================================================
 
-@pytest.fixture
-def client():
+@pytest.fixture(scope="module")
+def client(worker_tmp_dir):
     """
     Create a test client for the Flask application.
+
+    The client, its temporary directories and its events file are shared by
+    every test in this module; per-test isolation comes from
+    ``_reset_session``. All of them live under the xdist worker's own temp
+    dir, so the module can run with ``pytest -n auto`` and never writes to
+    the repository's events_data.json.
     """
-    flask_app.config['TESTING'] = True
-    flask_app.config['SECRET_KEY'] = 'test_secret_key'
-    
     # Use temporary directories for testing
-    with tempfile.TemporaryDirectory() as temp_dir:
-        flask_app.config['UPLOAD_FOLDER'] = os.path.join(temp_dir, 'uploads')
-        flask_app.config['PROCESSED_FOLDER'] = os.path.join(temp_dir, 'processed')
-        
-        os.makedirs(flask_app.config['UPLOAD_FOLDER'], exist_ok=True)
-        os.makedirs(flask_app.config['PROCESSED_FOLDER'], exist_ok=True)
-        
+    temp_dir = os.path.join(worker_tmp_dir, 'endpoints')
+    upload_folder = os.path.join(temp_dir, 'uploads')
+    processed_folder = os.path.join(temp_dir, 'processed')
+    os.makedirs(upload_folder, exist_ok=True)
+    os.makedirs(processed_folder, exist_ok=True)
+    
+    events_path = os.path.join(temp_dir, 'events_data.json')
+    with open(events_path, 'w') as f:
+        f.write('[]')
+    
+    # Everything patched here is restored when the module finishes
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(flask_app.config, 'TESTING', True)
+        mp.setitem(flask_app.config, 'SECRET_KEY', 'test_secret_key')
+        mp.setitem(flask_app.config, 'UPLOAD_FOLDER', upload_folder)
+        mp.setitem(flask_app.config, 'PROCESSED_FOLDER', processed_folder)
+        mp.setattr(app_module, 'EVENTS_DATA_PATH', events_path)
         with flask_app.test_client() as client:
             yield client
 
 
+@pytest.fixture(autouse=True)
+def _reset_session(client):
+    """
+    Clear the shared client's session before each test.
+    """
+    with client.session_transaction() as sess:
+        sess.clear()
+
+
 @pytest.fixture
 def authenticated_client(client):
     """
@@ -93,6 +117,20 @@ def test_homepage_loads(client):
         "Homepage should return HTML content"
 
 
+def test_healthz_endpoint(client):
+    """
+    Test that the health check responds without rendering a page
+    
+    **Validates: Requirements 4.3**
+    """
+    response = client.get('/healthz')
+    
+    assert response.status_code == 200, \
+        "Health check should return 200 OK status"
+    assert response.data == b'ok', \
+        "Health check should return a plain 'ok' body"
+
+
 def test_user_registration_endpoint_requires_fields(client):
     """
     Test that the user registration endpoint validates required fields
@@ -111,13 +149,14 @@ def test_user_registration_endpoint_requires_fields(client):
     assert response.status_code == 400, \
         "Registration should fail with missing fields"
     
-    data = json.loads(response.data)
+    data = loads(response.data)
     assert data['success'] is False, \
         "Failed registration should have success=False"
     assert 'error' in data, \
         "Failed registration should include error message"
 
 
+@pytest.mark.serial
 def test_user_registration_endpoint_structure(client):
     """
     Test that the user registration endpoint has correct structure
@@ -125,12 +164,11 @@ def test_user_registration_endpoint_structure(client):
     **Validates: Requirements 4.3**
     """
     # Test with valid data (will fail due to DB, but structure is correct)
-    import time
     response = client.post(
         '/register',
         json={
             'fullName': 'Test User',
-            'email': f'test_{int(time.time())}@example.com',  # Unique email
+            'email': f'test_{uuid.uuid4().hex[:12]}@example.com',  # Unique email
             'password': 'testpassword123',
             'userType': 'user'
         }
@@ -140,7 +178,7 @@ def test_user_registration_endpoint_structure(client):
     assert response.status_code in [201, 409, 500], \
         "Registration endpoint should respond"
     
-    data = json.loads(response.data)
+    data = loads(response.data)
     assert 'success' in data, \
         "Response should contain 'success' field"
 
@@ -163,7 +201,7 @@ def test_user_login_endpoint_requires_fields(client):
     assert response.status_code == 400, \
         "Login should fail with missing fields"
     
-    data = json.loads(response.data)
+    data = loads(response.data)
     assert data['success'] is False, \
         "Failed login should have success=False"
     assert 'error' in data, \
@@ -189,7 +227,7 @@ def test_user_login_endpoint_structure(client):
     assert response.status_code in [200, 401, 500], \
         "Login endpoint should respond"
     
-    data = json.loads(response.data)
+    data = loads(response.data)
     assert 'success' in data, \
         "Response should contain 'success' field"
 
@@ -213,7 +251,7 @@ def test_event_creation_endpoint_requires_authentication(client):
     assert response.status_code == 401, \
         "Event creation should require authentication"
     
-    data = json.loads(response.data)
+    data = loads(response.data)
     assert data['success'] is False, \
         "Unauthenticated event creation should fail"
     assert 'Unauthorized' in data['error'], \
@@ -238,7 +276,7 @@ def test_event_creation_endpoint_validates_fields(authenticated_client):
     assert response.status_code == 400, \
         "Event creation should fail with missing fields"
     
-    data = json.loads(response.data)
+    data = loads(response.data)
     assert data['success'] is False, \
         "Failed event creation should have success=False"
     assert 'error' in data, \
@@ -266,7 +304,7 @@ def test_event_creation_endpoint_structure(authenticated_client):
     assert response.status_code in [201, 500], \
         "Event creation endpoint should respond"
     
-    data = json.loads(response.data)
+    data = loads(response.data)
     assert 'success' in data, \
         "Response should contain 'success' field"
 
@@ -291,7 +329,7 @@ def test_photo_upload_endpoint_requires_authentication(client):
     assert response.status_code == 401, \
         "Photo upload should require authentication"
     
-    data = json.loads(response.data)
+    data = loads(response.data)
     assert data['success'] is False, \
         "Unauthenticated photo upload should fail"
     assert 'Unauthorized' in data['error'], \
@@ -314,7 +352,7 @@ def test_photo_upload_endpoint_validates_files(authenticated_client):
     assert response.status_code in [400, 404], \
         "Photo upload should fail with no files or missing event"
     
-    data = json.loads(response.data)
+    data = loads(response.data)
     assert data['success'] is False, \
         "Failed photo upload should have success=False"
 
@@ -330,7 +368,7 @@ def test_events_api_endpoint(client):
     assert response.status_code == 200, \
         "Events endpoint should return 200 OK"
     
-    data = json.loads(response.data)
+    data = loads(response.data)
     assert isinstance(data, list), \
         "Events endpoint should return a list"
 
@@ -347,42 +385,38 @@ def test_logout_endpoint(authenticated_client):
         "Logout should redirect or return success"
 
 
-def test_static_pages_load(client):
+@pytest.mark.parametrize('page', [
+    '/login',
+    '/signup'
+])
+def test_static_pages_load(client, page):
     """
     Test that static pages load correctly
     
     **Validates: Requirements 4.3**
     """
-    pages = [
-        '/login',
-        '/signup'
-    ]
-    
-    for page in pages:
-        response = client.get(page)
-        assert response.status_code == 200, \
-            f"Page {page} should load successfully"
+    response = client.get(page)
+    assert response.status_code == 200, \
+        f"Page {page} should load successfully"
 
 
-def test_protected_pages_require_authentication(client):
+@pytest.mark.parametrize('page', [
+    '/homepage',
+    '/event_discovery',
+    '/event_detail',
+    '/biometric_authentication_portal',
+    '/personal_photo_gallery',
+    '/download_page'
+])
+def test_protected_pages_require_authentication(client, page):
     """
     Test that protected pages require authentication
     
     **Validates: Requirements 4.3**
     """
-    protected_pages = [
-        '/homepage',
-        '/event_discovery',
-        '/event_detail',
-        '/biometric_authentication_portal',
-        '/personal_photo_gallery',
-        '/download_page'
-    ]
-    
-    for page in protected_pages:
-        response = client.get(page, follow_redirects=False)
-        assert response.status_code == 302, \
-            f"Protected page {page} should redirect when not authenticated"
+    response = client.get(page, follow_redirects=False)
+    assert response.status_code == 302, \
+        f"Protected page {page} should redirect when not authenticated"
 
 
 def test_admin_endpoints_require_admin_auth(client):
@@ -397,7 +431,7 @@ def test_admin_endpoints_require_admin_auth(client):
     assert response.status_code == 403, \
         "Admin endpoints should require admin authentication"
     
-    data = json.loads(response.data)
+    data = loads(response.data)
     assert data['success'] is False, \
         "Unauthenticated admin access should fail"
 
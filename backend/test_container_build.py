@@ -10,10 +10,43 @@ for the docker deployment feature.
 
 import pytest
 import os
-import subprocess
+import json
 import sys
 from hypothesis import given, settings, strategies as st
 
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from testutils import docker_image_tag, prune_test_images
+
+
+# Distribution name -> import name of the packages the image must provide
+REQUIRED_PACKAGES = {
+    'flask': 'flask',
+    'face-recognition': 'face_recognition',
+    'numpy': 'numpy',
+    'opencv-python': 'cv2',
+    'psycopg2': 'psycopg2',
+}
+
+# Runs inside the image; %r is the list of modules to import
+_PROBE_SCRIPT = """
+import importlib, json, os, sys
+out = {'python': sys.version, 'app': os.path.exists('/app/app.py'), 'packages': {}}
+for name in %r:
+    try:
+        importlib.import_module(name)
+        out['packages'][name] = True
+    except Exception:
+        out['packages'][name] = False
+try:
+    import gunicorn
+    out['gunicorn'] = gunicorn.__version__
+except ImportError:
+    out['gunicorn'] = None
+print(json.dumps(out))
+"""
+
 
 # ============================================================================
 # Property 1: Container build completeness
@@ -21,7 +54,26 @@ from hypothesis import given, settings, strategies as st
 # **Validates: Requirements 1.1, 1.2, 1.3, 1.4, 1.5**
 # ============================================================================
 
-def test_property_container_build_completeness():
+@pytest.fixture(scope="module")
+def docker_client():
+    """
+    One docker SDK client (a single daemon socket connection) for the module.
+    """
+    docker = pytest.importorskip('docker')
+    
+    # Check if Docker is available
+    try:
+        client = docker.from_env()
+        client.ping()
+    except docker.errors.DockerException:
+        pytest.skip("Docker is not available on this system")
+    
+    yield client
+    client.close()
+
+
+@pytest.mark.slow
+def test_property_container_build_completeness(docker_client):
     """
     Property 1: Container build completeness
     
@@ -32,137 +84,73 @@ def test_property_container_build_completeness():
     **Feature: docker-deployment, Property 1: Container build completeness**
     **Validates: Requirements 1.1, 1.2, 1.3, 1.4, 1.5**
     """
+    docker_errors = pytest.importorskip('docker.errors')
+    
     # Get the project root directory (parent of backend)
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     
-    # Check if Docker is available
+    # The tag hashes every file in the build context (.dockerignore applied),
+    # so an existing image with this tag was built from the same context and
+    # the build can be skipped
+    image_tag = docker_image_tag(project_root)
+    
     try:
-        result = subprocess.run(
-            ['docker', '--version'],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        if result.returncode != 0:
-            pytest.skip("Docker is not available on this system")
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        pytest.skip("Docker is not available on this system")
+        image = docker_client.images.get(image_tag)
+    except docker_errors.ImageNotFound:
+        # Build the Docker image
+        try:
+            image, _ = docker_client.images.build(
+                path=project_root,
+                tag=image_tag,
+                timeout=600  # 10 minutes timeout for build
+            )
+        except (docker_errors.BuildError, docker_errors.APIError) as e:
+            # Verify build completed successfully
+            pytest.fail(f"Docker build should complete without errors. Error: {e}")
+        prune_test_images(docker_client, image_tag)
     
-    # Build the Docker image
-    build_result = subprocess.run(
-        ['docker', 'build', '-t', 'picme-test', '.'],
-        cwd=project_root,
-        capture_output=True,
-        text=True,
-        timeout=600  # 10 minutes timeout for build
-    )
+    # Verify the image was created
+    assert image_tag in image.tags, \
+        f"Docker image '{image_tag}' should exist after build"
     
-    # Verify build completed successfully
-    assert build_result.returncode == 0, \
-        f"Docker build should complete without errors. Error: {build_result.stderr}"
+    # Verify image size is reasonable (< 2GB = 2147483648 bytes)
+    size_bytes = image.attrs['Size']
+    assert size_bytes < 2 * 1024 ** 3, \
+        f"Image size should be less than 2GB, got {size_bytes / 1024 ** 3:.2f}GB"
     
-    # Verify the image was created
-    inspect_result = subprocess.run(
-        ['docker', 'inspect', 'picme-test'],
-        capture_output=True,
-        text=True,
-        timeout=10
-    )
+    # Verify required components are in the image with a single container:
+    # Python version, gunicorn, required packages and app.py are all probed
+    # by one script that reports back as JSON
+    try:
+        output = docker_client.containers.run(
+            image_tag,
+            ['python', '-c', _PROBE_SCRIPT % (list(REQUIRED_PACKAGES.values()),)],
+            remove=True
+        )
+    except docker_errors.ContainerError as e:
+        pytest.fail(f"Python should be installed in the image. Error: {e.stderr}")
     
-    assert inspect_result.returncode == 0, \
-        "Docker image 'picme-test' should exist after build"
+    probe = json.loads(output.decode('utf-8').strip().splitlines()[-1])
     
-    # Verify image size is reasonable (< 2GB = 2147483648 bytes)
-    size_result = subprocess.run(
-        ['docker', 'images', 'picme-test', '--format', '{{.Size}}'],
-        capture_output=True,
-        text=True,
-        timeout=10
-    )
-    
-    assert size_result.returncode == 0, \
-        "Should be able to query image size"
-    
-    # Parse size (format could be like "1.5GB" or "500MB")
-    size_str = size_result.stdout.strip()
-    
-    # Extract numeric value and unit
-    import re
-    match = re.match(r'([\d.]+)([A-Z]+)', size_str)
-    if match:
-        size_value = float(match.group(1))
-        size_unit = match.group(2)
-        
-        # Convert to GB for comparison
-        if size_unit == 'MB':
-            size_gb = size_value / 1024
-        elif size_unit == 'GB':
-            size_gb = size_value
-        elif size_unit == 'KB':
-            size_gb = size_value / (1024 * 1024)
-        else:
-            size_gb = 0
-        
-        assert size_gb < 2.0, \
-            f"Image size should be less than 2GB, got {size_str}"
-    
-    # Verify required components are in the image
     # Check that Python is installed
-    python_check = subprocess.run(
-        ['docker', 'run', '--rm', 'picme-test', 'python', '--version'],
-        capture_output=True,
-        text=True,
-        timeout=30
-    )
-    
-    assert python_check.returncode == 0, \
-        "Python should be installed in the image"
-    assert 'Python 3.10' in python_check.stdout, \
+    assert probe['python'].startswith('3.10'), \
         "Python 3.10 should be installed"
     
     # Check that gunicorn is installed
-    gunicorn_check = subprocess.run(
-        ['docker', 'run', '--rm', 'picme-test', 'gunicorn', '--version'],
-        capture_output=True,
-        text=True,
-        timeout=30
-    )
-    
-    assert gunicorn_check.returncode == 0, \
+    assert probe['gunicorn'] is not None, \
         "Gunicorn should be installed in the image"
     
     # Check that required Python packages are installed
-    packages_to_check = ['flask', 'face-recognition', 'numpy', 'opencv-python', 'psycopg2']
-    
-    for package in packages_to_check:
-        package_check = subprocess.run(
-            ['docker', 'run', '--rm', 'picme-test', 'python', '-c', 
-             f'import {package.replace("-", "_")}'],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        assert package_check.returncode == 0, \
+    for package, module_name in REQUIRED_PACKAGES.items():
+        assert probe['packages'][module_name], \
             f"Package {package} should be installed in the image"
     
     # Check that app.py exists in the image
-    app_check = subprocess.run(
-        ['docker', 'run', '--rm', 'picme-test', 'ls', '/app/app.py'],
-        capture_output=True,
-        text=True,
-        timeout=30
-    )
-    
-    assert app_check.returncode == 0, \
+    assert probe['app'], \
         "app.py should exist in /app directory"
     
-    # Cleanup: remove the test image
-    subprocess.run(
-        ['docker', 'rmi', 'picme-test'],
-        capture_output=True,
-        timeout=30
-    )
+    # The image is kept so the next run with an unchanged tree reuses it;
+    # tags from older trees were pruned right after the build
 
 
 def test_dockerfile_exists():
@@ -7,85 +7,94 @@ for containerizing the PicMe application.
 Requirements: 1.1, 1.2, 1.3, 1.4, 1.5
 """
 
+import collections
+import functools
 import os
+import re
 import pytest
 
+# System packages dlib and OpenCV need inside the image
+REQUIRED_SYSTEM_PACKAGES = [
+    'build-essential',
+    'cmake',
+    'libgl1',
+    'libglib2.0-0'
+]
+SYSTEM_PACKAGE_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, REQUIRED_SYSTEM_PACKAGES)) + r')\b'
+)
 
+
+@functools.lru_cache(maxsize=1)
 def read_dockerfile():
-    """Helper function to read the Dockerfile content."""
+    """Helper function to read the Dockerfile content (read once per session)."""
     dockerfile_path = os.path.join(os.path.dirname(__file__), '..', 'Dockerfile')
     with open(dockerfile_path, 'r') as f:
         return f.read()
 
 
-def test_dockerfile_contains_correct_base_image():
+@functools.lru_cache(maxsize=1)
+def parse_dockerfile():
     """
-    Test that Dockerfile contains correct base image.
+    Parse the Dockerfile once into ``{directive: [arguments, ...]}``.
     
-    Validates: Requirements 1.1
+    Continuation lines are joined and comments skipped, so for example
+    ``parse_dockerfile()['EXPOSE'] == ['8080']``.
     """
-    content = read_dockerfile()
-    assert 'FROM python:3.10-slim' in content, \
-        "Dockerfile must use python:3.10-slim as base image"
+    directives = collections.defaultdict(list)
+    logical_line = ''
+    for line in read_dockerfile().splitlines():
+        stripped = line.strip()
+        if not logical_line and (not stripped or stripped.startswith('#')):
+            continue
+        if stripped.endswith('\\'):
+            logical_line += stripped[:-1] + ' '
+            continue
+        directive, _, arguments = (logical_line + stripped).partition(' ')
+        directives[directive.upper()].append(arguments.strip())
+        logical_line = ''
+    return dict(directives)
 
 
-def test_dockerfile_contains_all_required_system_packages():
-    """
-    Test that Dockerfile contains all required system packages for dlib and OpenCV.
-    
-    Validates: Requirements 1.2
-    """
-    content = read_dockerfile()
-    
-    required_packages = [
-        'build-essential',
-        'cmake',
-        'libgl1',
-        'libglib2.0-0'
-    ]
-    
-    for package in required_packages:
-        assert package in content, \
-            f"Dockerfile must install {package} for dlib/OpenCV compatibility"
+def directive_args(directive):
+    """All arguments given to ``directive`` in the Dockerfile, in order."""
+    return parse_dockerfile().get(directive, [])
 
 
-def test_dockerfile_cleans_apt_cache():
+@pytest.mark.parametrize("directive,needle,message", [
+    # Requirements 1.1
+    ('FROM', 'python:3.10-slim', "Dockerfile must use python:3.10-slim as base image"),
+    # Requirements 6.1, 6.2
+    ('RUN', 'rm -rf /var/lib/apt/lists/*', "Dockerfile must clean up apt cache to minimize image size"),
+    # Requirements 1.3
+    ('WORKDIR', '/app', "Dockerfile must set WORKDIR to /app"),
+    ('COPY', 'backend /app', "Dockerfile must copy backend directory to /app"),
+    # Requirements 1.4
+    ('RUN', 'pip install --upgrade pip', "Dockerfile must upgrade pip before installing packages"),
+    # Requirements 1.5
+    ('EXPOSE', '8080', "Dockerfile must expose port 8080"),
+])
+def test_dockerfile_contains(directive, needle, message):
     """
-    Test that Dockerfile cleans up apt cache to reduce image size.
+    Test that Dockerfile contains each required instruction.
     
-    Validates: Requirements 6.1, 6.2
+    Validates: Requirements 1.1, 1.3, 1.4, 1.5, 6.1, 6.2
     """
-    content = read_dockerfile()
-    assert 'rm -rf /var/lib/apt/lists/*' in content, \
-        "Dockerfile must clean up apt cache to minimize image size"
+    assert any(needle in args for args in directive_args(directive)), message
 
 
-def test_dockerfile_contains_correct_copy_commands():
-    """
-    Test that Dockerfile contains correct COPY commands.
-    
-    Validates: Requirements 1.3
+def test_dockerfile_contains_all_required_system_packages():
     """
-    content = read_dockerfile()
-    
-    # Check for WORKDIR
-    assert 'WORKDIR /app' in content, \
-        "Dockerfile must set WORKDIR to /app"
+    Test that Dockerfile contains all required system packages for dlib and OpenCV.
     
-    # Check for COPY backend command
-    assert 'COPY backend /app' in content, \
-        "Dockerfile must copy backend directory to /app"
-
-
-def test_dockerfile_upgrades_pip():
+    Validates: Requirements 1.2
     """
-    Test that Dockerfile upgrades pip before installing packages.
+    run_commands = '\n'.join(directive_args('RUN'))
     
-    Validates: Requirements 1.4
-    """
-    content = read_dockerfile()
-    assert 'pip install --upgrade pip' in content, \
-        "Dockerfile must upgrade pip before installing packages"
+    found = set(SYSTEM_PACKAGE_RE.findall(run_commands))
+    missing = set(REQUIRED_SYSTEM_PACKAGES) - found
+    assert not missing, \
+        f"Dockerfile must install {sorted(missing)} for dlib/OpenCV compatibility"
 
 
 def test_dockerfile_installs_requirements():
@@ -94,29 +103,18 @@ def test_dockerfile_installs_requirements():
     
     Validates: Requirements 1.4
     """
-    content = read_dockerfile()
-    assert 'pip install' in content and '-r requirements.txt' in content, \
+    assert any('pip install' in args and '-r requirements.txt' in args
+               for args in directive_args('RUN')), \
         "Dockerfile must install packages from requirements.txt"
 
 
-def test_dockerfile_exposes_correct_port():
-    """
-    Test that Dockerfile exposes port 8080.
-    
-    Validates: Requirements 1.5
-    """
-    content = read_dockerfile()
-    assert 'EXPOSE 8080' in content, \
-        "Dockerfile must expose port 8080"
-
-
 def test_dockerfile_contains_correct_cmd():
     """
     Test that Dockerfile contains correct CMD for running gunicorn.
     
     Validates: Requirements 1.5, 5.1, 5.2, 5.3
     """
-    content = read_dockerfile()
+    content = '\n'.join(directive_args('CMD'))
     
     # Check for gunicorn command
     assert 'gunicorn' in content, \
@@ -140,7 +138,7 @@ def test_dockerfile_configures_gunicorn_workers():
     
     Validates: Requirements 5.3
     """
-    content = read_dockerfile()
+    content = '\n'.join(directive_args('CMD'))
     
     # Check for worker configuration (either inline or via config file)
     has_inline_workers = '-w' in content or '--workers' in content
@@ -156,7 +154,7 @@ def test_dockerfile_configures_gunicorn_timeout():
     
     Validates: Requirements 5.3
     """
-    content = read_dockerfile()
+    content = '\n'.join(directive_args('CMD'))
     
     # Check for timeout configuration
     assert '--timeout' in content or 'timeout' in content, \
@@ -180,19 +178,24 @@ def test_dockerfile_structure_order():
     pip_index = -1
     cmd_index = -1
     
+    # Record the first occurrence of each directive and stop once all are found
     for i, line in enumerate(lines):
-        if line.startswith('FROM'):
+        stripped = line.lstrip()
+        if from_index == -1 and stripped.startswith('FROM'):
             from_index = i
-        elif 'apt-get' in line:
+        elif apt_index == -1 and 'apt-get' in stripped:
             apt_index = i
-        elif line.startswith('WORKDIR'):
+        elif workdir_index == -1 and stripped.startswith('WORKDIR'):
             workdir_index = i
-        elif line.startswith('COPY'):
+        elif copy_index == -1 and stripped.startswith('COPY'):
             copy_index = i
-        elif 'pip install' in line:
+        elif pip_index == -1 and 'pip install' in stripped:
             pip_index = i
-        elif line.startswith('CMD'):
+        elif cmd_index == -1 and stripped.startswith('CMD'):
             cmd_index = i
+        
+        if -1 not in (from_index, apt_index, workdir_index, copy_index, pip_index, cmd_index):
+            break
     
     # Verify order: FROM -> apt-get -> WORKDIR -> COPY -> pip -> CMD
     assert from_index < apt_index, "FROM must come before apt-get"
@@ -2,10 +2,13 @@
 Test error handling for download page APIs
 """
 import pytest
-import json
 import os
 import tempfile
 from app import app, EVENTS_DATA_PATH
+from testutils import loads
+
+# One more than the 500-photo download limit; the API only checks the count
+_OVERSIZED_PHOTOS = [{'filename': 'photo.jpg', 'photoType': 'individual'}] * 501
 
 @pytest.fixture
 def client():
@@ -15,13 +18,21 @@ def client():
     with app.test_client() as client:
         yield client
 
+# Session of a logged-in user whose face has been matched to a person
+_AUTHENTICATED_SESSION = {
+    'logged_in': True,
+    'user_email': 'test@example.com',
+    'person_id': 'test_person_123'
+}
+
 @pytest.fixture
 def authenticated_session(client):
     """Create an authenticated session"""
-    with client.session_transaction() as sess:
-        sess['logged_in'] = True
-        sess['user_email'] = 'test@example.com'
-        sess['person_id'] = 'test_person_123'
+    # Sign the cookie directly rather than via session_transaction(); it is
+    # signed here, not at import, because client sets the SECRET_KEY
+    serializer = app.session_interface.get_signing_serializer(app)
+    client.set_cookie('localhost', app.session_cookie_name,
+                      serializer.dumps(_AUTHENTICATED_SESSION))
     return client
 
 def test_user_photos_no_person_id(client):
@@ -33,74 +44,65 @@ def test_user_photos_no_person_id(client):
     
     response = client.get('/api/user_photos')
     assert response.status_code == 404
-    data = json.loads(response.data)
+    data = loads(response.data)
     assert data['success'] == False
     assert 'error_code' in data
     assert data['error_code'] == 'NO_PERSON_ID'
 
-def test_user_photos_empty_processed_folder(authenticated_session):
+def test_user_photos_empty_processed_folder(authenticated_session, monkeypatch):
     """Test user_photos API handles missing processed folder gracefully"""
-    # Set the processed folder to a nonexistent path
-    original_folder = app.config['PROCESSED_FOLDER']
-    app.config['PROCESSED_FOLDER'] = '/nonexistent/path'
+    # Set the processed folder to a nonexistent path (restored by monkeypatch)
+    monkeypatch.setitem(app.config, 'PROCESSED_FOLDER', '/nonexistent/path')
     
-    try:
-        response = authenticated_session.get('/api/user_photos')
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        assert data['success'] == True
-        assert data['events'] == []
-        assert data['total_photos'] == 0
-    finally:
-        # Restore original folder
-        app.config['PROCESSED_FOLDER'] = original_folder
+    response = authenticated_session.get('/api/user_photos')
+    assert response.status_code == 200
+    data = loads(response.data)
+    assert data['success'] == True
+    assert data['events'] == []
+    assert data['total_photos'] == 0
 
-def test_download_photos_missing_parameters(authenticated_session):
-    """Test download_photos API validates required parameters"""
-    response = authenticated_session.post('/api/download_photos',
-                                         json={},
-                                         content_type='application/json')
-    assert response.status_code == 400
-    data = json.loads(response.data)
-    assert data['success'] == False
-    assert 'error_code' in data
+@pytest.mark.parametrize("payload,status,error_code", [
     # Empty JSON object {} is falsy, so it triggers INVALID_REQUEST
-    assert data['error_code'] == 'INVALID_REQUEST'
-
-def test_download_photos_invalid_request(authenticated_session):
-    """Test download_photos API handles invalid JSON"""
-    response = authenticated_session.post('/api/download_photos',
-                                         data='invalid json',
-                                         content_type='application/json')
+    pytest.param({}, 400, 'INVALID_REQUEST', id='missing_parameters'),
     # Invalid JSON causes an exception that's caught by the outer handler, returning 500
-    assert response.status_code == 500
-    data = json.loads(response.data)
-    assert data['success'] == False
-    assert 'error_code' in data
-    assert data['error_code'] == 'INTERNAL_ERROR'
-
-def test_download_photos_too_many_photos(authenticated_session):
-    """Test download_photos API enforces photo limit"""
-    # Create request with more than 500 photos
-    photos = [{'filename': f'photo_{i}.jpg', 'photoType': 'individual'} for i in range(501)]
-    
-    response = authenticated_session.post('/api/download_photos',
-                                         json={
-                                             'event_id': 'test_event',
-                                             'person_id': 'test_person',
-                                             'photos': photos
-                                         },
-                                         content_type='application/json')
-    assert response.status_code == 413
-    data = json.loads(response.data)
+    pytest.param('invalid json', 500, 'INTERNAL_ERROR', id='invalid_request'),
+    # More than 500 photos exceeds the download limit
+    pytest.param({
+        'event_id': 'test_event',
+        'person_id': 'test_person',
+        'photos': _OVERSIZED_PHOTOS
+    }, 413, 'TOO_MANY_PHOTOS', id='too_many_photos'),
+    pytest.param({
+        'event_id': 'test_event',
+        'person_id': 'test_person',
+        'photos': 'not_a_list'
+    }, 400, 'INVALID_PHOTOS_FORMAT', id='invalid_photos_format'),
+    # Empty list is treated as missing parameter due to Python's falsy behavior
+    pytest.param({
+        'event_id': 'test_event',
+        'person_id': 'test_person',
+        'photos': []
+    }, 400, 'MISSING_PARAMETERS', id='empty_photos_list'),
+])
+def test_download_photos_request_errors(authenticated_session, payload, status, error_code):
+    """Test download_photos API rejects malformed requests with the right error code"""
+    if isinstance(payload, str):
+        response = authenticated_session.post('/api/download_photos',
+                                             data=payload,
+                                             content_type='application/json')
+    else:
+        response = authenticated_session.post('/api/download_photos',
+                                             json=payload)
+    assert response.status_code == status
+    data = loads(response.data)
     assert data['success'] == False
     assert 'error_code' in data
-    assert data['error_code'] == 'TOO_MANY_PHOTOS'
+    assert data['error_code'] == error_code
 
-def test_download_photos_no_photos_found(authenticated_session, tmp_path):
+def test_download_photos_no_photos_found(authenticated_session, tmp_path, monkeypatch):
     """Test download_photos API handles case when no photos exist"""
-    # Set up temporary processed folder
-    app.config['PROCESSED_FOLDER'] = str(tmp_path)
+    # Set up temporary processed folder (restored by monkeypatch)
+    monkeypatch.setitem(app.config, 'PROCESSED_FOLDER', str(tmp_path))
     
     response = authenticated_session.post('/api/download_photos',
                                          json={
@@ -109,45 +111,13 @@ def test_download_photos_no_photos_found(authenticated_session, tmp_path):
                                              'photos': [
                                                  {'filename': 'photo1.jpg', 'photoType': 'individual'}
                                              ]
-                                         },
-                                         content_type='application/json')
+                                         })
     assert response.status_code == 404
-    data = json.loads(response.data)
+    data = loads(response.data)
     assert data['success'] == False
     assert 'error_code' in data
     assert data['error_code'] == 'NO_PHOTOS_FOUND'
 
-def test_download_photos_invalid_photos_format(authenticated_session):
-    """Test download_photos API validates photos parameter is a list"""
-    response = authenticated_session.post('/api/download_photos',
-                                         json={
-                                             'event_id': 'test_event',
-                                             'person_id': 'test_person',
-                                             'photos': 'not_a_list'
-                                         },
-                                         content_type='application/json')
-    assert response.status_code == 400
-    data = json.loads(response.data)
-    assert data['success'] == False
-    assert 'error_code' in data
-    assert data['error_code'] == 'INVALID_PHOTOS_FORMAT'
-
-def test_download_photos_empty_photos_list(authenticated_session):
-    """Test download_photos API handles empty photos list"""
-    response = authenticated_session.post('/api/download_photos',
-                                         json={
-                                             'event_id': 'test_event',
-                                             'person_id': 'test_person',
-                                             'photos': []
-                                         },
-                                         content_type='application/json')
-    assert response.status_code == 400
-    data = json.loads(response.data)
-    assert data['success'] == False
-    assert 'error_code' in data
-    # Empty list is treated as missing parameter due to Python's falsy behavior
-    assert data['error_code'] == 'MISSING_PARAMETERS'
-
 def test_user_photos_session_expired(client):
     """Test user_photos API handles expired session"""
     # No session data at all
@@ -163,8 +133,7 @@ def test_download_photos_session_expired(client):
                               'event_id': 'test_event',
                               'person_id': 'test_person',
                               'photos': [{'filename': 'photo1.jpg', 'photoType': 'individual'}]
-                          },
-                          content_type='application/json')
+                          })
     # Should redirect to login (302) or return 401
     assert response.status_code in [302, 401]
 
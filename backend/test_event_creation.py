@@ -3,83 +3,169 @@ Property-based tests for event creation with thumbnail support.
 
 These tests validate the correctness properties defined in the design document
 for the admin event editing feature.
+
+Safe to run under pytest-xdist (pytest -n 4 backend/test_event_creation.py):
+each worker process builds its own module-scoped client with a private temp
+directory for the events file and uploads, so workers never share state.
 """
 
 import pytest
 import os
 import json
-import tempfile
 import shutil
-from hypothesis import given, settings, strategies as st, HealthCheck
-from hypothesis import assume
+from hypothesis import given, settings, strategies as st, HealthCheck, Phase
 from io import BytesIO
-from PIL import Image
-import sys
-
-# Add parent directory to path to import app
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from string import ascii_letters, digits
+from flask.sessions import SecureCookieSessionInterface
 
-from app import app, EVENTS_DATA_PATH, UPLOAD_FOLDER
+# Bind the module now: test_config.py re-imports app, and a later
+# "import app" would return a module that isn't serving this app's routes
+import app as app_module
+from app import app
+from testutils import loads, ram_tmp_dir
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Create a test client for the Flask app"""
+    """
+    Create one test client for the Flask app, shared by the whole module.
+    
+    The events file and upload folders live on tmpfs where available, so the
+    events JSON read/written by every request never goes to disk.
+    """
     app.config['TESTING'] = True
-    app.config['UPLOAD_FOLDER'] = tempfile.mkdtemp()
-    
-    # Create a temporary events data file
-    temp_events_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-    temp_events_file.write('[]')
-    temp_events_file.close()
-    
-    # Store original paths
-    original_events_path = app.config.get('EVENTS_DATA_PATH', EVENTS_DATA_PATH)
-    
-    # Override the events data path
-    import app as app_module
-    app_module.EVENTS_DATA_PATH = temp_events_file.name
-    
-    with app.test_client() as client:
-        with app.app_context():
-            # Create admin session
-            with client.session_transaction() as sess:
-                sess['admin_logged_in'] = True
-                sess['admin_id'] = 1
-                sess['admin_email'] = 'test@example.com'
+    
+    # mkdtemp already makes the directory unique; the worker ID in the
+    # name just shows which pytest-xdist worker a leftover came from
+    tmp_dir = ram_tmp_dir(prefix=f"picme_{os.environ.get('PYTEST_XDIST_WORKER', 'gw0')}_")
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(app.config, 'UPLOAD_FOLDER', os.path.join(tmp_dir, 'uploads'))
+        mp.setitem(app.config, 'PROCESSED_FOLDER', os.path.join(tmp_dir, 'processed'))
+        mp.setattr(app_module, 'EVENTS_DATA_PATH', os.path.join(tmp_dir, 'events_data.json'))
+        # No test here fetches the QR image, only the qr_code URL
+        mp.setitem(app.config, 'SKIP_MEDIA_GENERATION', True)
         
-        yield client
+        # Events created by module-scoped fixtures stay in the file; every
+        # test looks its events up by ID
+        with open(app_module.EVENTS_DATA_PATH, 'w') as f:
+            f.write('[]')
+        
+        with app.test_client() as client:
+            yield client
     
     # Cleanup
-    try:
-        shutil.rmtree(app.config['UPLOAD_FOLDER'])
-        os.unlink(temp_events_file.name)
-    except:
-        pass
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+@pytest.fixture(scope="module")
+def admin_session_cookie():
+    """Signed session cookie for admin 1, built once per module"""
+    serializer = SecureCookieSessionInterface().get_signing_serializer(app)
+    return serializer.dumps({
+        'admin_logged_in': True,
+        'admin_id': 1,
+        'admin_email': 'test@example.com'
+    })
+
+
+@pytest.fixture(autouse=True)
+def reset_state(client, admin_session_cookie):
+    """
+    Start every test with a fresh admin 1 session, and roll back its changes
+    to the events file and upload folders afterwards.
+    
+    The snapshot is taken after module-scoped fixtures have run, so events
+    they created survive while edits made to them by a test do not.
+    """
+    client.set_cookie('localhost', app.session_cookie_name, admin_session_cookie)
+    
+    with open(app_module.EVENTS_DATA_PATH, 'rb') as f:
+        events_snapshot = f.read()
+    folders = [app.config['UPLOAD_FOLDER'], app.config['PROCESSED_FOLDER']]
+    folder_snapshots = {
+        folder: set(os.listdir(folder)) if os.path.isdir(folder) else set()
+        for folder in folders
+    }
     
-    # Restore original path
-    app_module.EVENTS_DATA_PATH = original_events_path
+    yield
+    
+    with open(app_module.EVENTS_DATA_PATH, 'wb') as f:
+        f.write(events_snapshot)
+    for folder, before in folder_snapshots.items():
+        if os.path.isdir(folder):
+            for name in set(os.listdir(folder)) - before:
+                shutil.rmtree(os.path.join(folder, name), ignore_errors=True)
+
+
+# Smallest valid 1x1 images; tests only need a real PNG/JPEG file to upload
+_PNG_1X1 = bytes.fromhex(
+    '89504e470d0a1a0a0000000d4948445200000001000000010802000000907753'
+    'de0000000c49444154789c63f8cfc0000003010100c9fe92ef0000000049454e'
+    '44ae426082'
+)
+_JPEG_1X1 = bytes.fromhex(
+    'ffd8ffe000104a46494600010100000100010000ffdb00430008060607060508'
+    '0707070909080a0c140d0c0b0b0c1912130f141d1a1f1e1d1a1c1c20242e2720'
+    '222c231c1c2837292c30313434341f27393d38323c2e333432ffc0000b080001'
+    '000101011100ffc40014000100000000000000000000000000000008ffc40014'
+    '100100000000000000000000000000000000ffda0008010100003f003fbfffd9'
+)
 
 
 def create_test_image(format='PNG'):
     """Create a test image in memory"""
-    img = Image.new('RGB', (100, 100), color='red')
-    img_bytes = BytesIO()
-    # PIL uses 'JPEG' not 'JPG'
-    pil_format = 'JPEG' if format.upper() == 'JPG' else format.upper()
-    img.save(img_bytes, format=pil_format)
-    img_bytes.seek(0)
-    return img_bytes
+    return BytesIO(_PNG_1X1 if format.upper() == 'PNG' else _JPEG_1X1)
+
+
+def _by_id(response):
+    """Index an /events response by event ID"""
+    events = loads(response.data)
+    by_id = {e['id']: e for e in events}
+    assert len(by_id) == len(events), "Event IDs should be unique"
+    return by_id
+
+
+# Non-blank text by construction: a leading letter followed by up to 39
+# letters, digits or spaces, so no draw is ever rejected by a filter
+non_blank_text = st.builds(
+    lambda first, rest: first + rest,
+    st.sampled_from(ascii_letters),
+    st.text(alphabet=ascii_letters + digits + ' ', max_size=39)
+)
+
+
+def thumbnail_path(client, event_id, filename):
+    """Path a thumbnail is stored at in the client's upload folder"""
+    return os.path.join(client.application.config['UPLOAD_FOLDER'], event_id, filename)
+
+
+def fetch_event(client, event_id):
+    """Fetch one event from GET /api/events/<id>, or None if it doesn't exist"""
+    response = client.get(f'/api/events/{event_id}')
+    if response.status_code == 404:
+        return None
+    assert response.status_code == 200
+    return loads(response.data)
 
 
 # Strategy for generating valid event data
 event_data_strategy = st.fixed_dictionaries({
-    'eventName': st.text(min_size=1, max_size=100).filter(lambda x: x.strip()),
-    'eventLocation': st.text(min_size=1, max_size=100).filter(lambda x: x.strip()),
+    'eventName': non_blank_text,
+    'eventLocation': non_blank_text,
     'eventDate': st.dates().map(lambda d: d.isoformat()),
     'eventCategory': st.sampled_from(['Festival', 'Corporate', 'Wedding', 'Conference', 'Party', 'Sports', 'Other'])
 })
 
+# Settings for smoke-level property tests over event_data_strategy: every
+# example goes through the HTTP client, so skip shrinking and stay small
+event_property_settings = settings(
+    max_examples=25,
+    deadline=None,
+    phases=[Phase.explicit, Phase.generate],
+    suppress_health_check=[HealthCheck.too_slow, HealthCheck.function_scoped_fixture]
+)
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -106,20 +192,19 @@ def test_edit_modal_opens_with_correct_prepopulated_data(client):
     }
     
     response = client.post('/api/create_event',
-                          data=json.dumps(event_data),
-                          content_type='application/json')
+                          json=event_data)
     
     assert response.status_code == 201
-    response_data = json.loads(response.data)
+    response_data = loads(response.data)
     event_id = response_data['event_id']
     
     # Fetch events to verify the data that would be used to pre-populate the modal
     response = client.get('/events')
     assert response.status_code == 200
-    events = json.loads(response.data)
+    events = _by_id(response)
     
     # Find the created event
-    event = next((e for e in events if e['id'] == event_id), None)
+    event = events.get(event_id)
     assert event is not None, "Event should be returned by /events API"
     
     # Verify all fields are present and correct (these would pre-populate the modal)
@@ -130,98 +215,84 @@ def test_edit_modal_opens_with_correct_prepopulated_data(client):
     assert 'image' in event  # Thumbnail path should be present
 
 
-def test_update_individual_fields(client):
+@event_property_settings
+@given(event_data=event_data_strategy)
+def test_created_event_round_trips_through_api(client, event_data):
     """
-    Test updating each field individually to ensure each field can be updated independently.
+    Property: for any valid event data, the event created from it is
+    returned by GET /api/events/<id> with exactly the submitted fields.
     
     Requirements: 5.1, 5.2, 5.3, 5.4, 5.5
     """
-    # Create an event
-    event_data = {
-        'eventName': 'Original Name',
-        'eventLocation': 'Original Location',
-        'eventDate': '2024-12-25',
-        'eventCategory': 'Festival'
-    }
-    
     response = client.post('/api/create_event',
-                          data=json.dumps(event_data),
-                          content_type='application/json')
+                          json=event_data)
     
     assert response.status_code == 201
-    response_data = json.loads(response.data)
-    event_id = response_data['event_id']
-    
-    # Test updating name only
-    update_data = {
-        'name': 'Updated Name',
-        'location': event_data['eventLocation'],
-        'date': event_data['eventDate'],
-        'category': event_data['eventCategory']
-    }
-    
-    response = client.put(f'/api/events/{event_id}',
-                         data=json.dumps(update_data),
-                         content_type='application/json')
-    
-    assert response.status_code == 200
-    response_data = json.loads(response.data)
-    assert response_data['event']['name'] == 'Updated Name'
+    event = fetch_event(client, loads(response.data)['event_id'])
     
-    # Test updating location only
-    update_data['location'] = 'Updated Location'
-    response = client.put(f'/api/events/{event_id}',
-                         data=json.dumps(update_data),
-                         content_type='application/json')
+    assert event is not None
+    assert event['name'] == event_data['eventName']
+    assert event['location'] == event_data['eventLocation']
+    assert event['date'] == event_data['eventDate']
+    assert event['category'] == event_data['eventCategory']
+
+
+BASE_EVENT_DATA = {
+    'eventName': 'Original Name',
+    'eventLocation': 'Original Location',
+    'eventDate': '2024-12-25',
+    'eventCategory': 'Festival'
+}
+
+
+@pytest.fixture(scope="module")
+def base_event(client, admin_session_cookie):
+    """Create one event for the field-update tests, shared by the module"""
+    client.set_cookie('localhost', app.session_cookie_name, admin_session_cookie)
     
-    assert response.status_code == 200
-    response_data = json.loads(response.data)
-    assert response_data['event']['location'] == 'Updated Location'
+    response = client.post('/api/create_event',
+                          json=BASE_EVENT_DATA)
     
-    # Test updating date only
-    update_data['date'] = '2025-01-15'
-    response = client.put(f'/api/events/{event_id}',
-                         data=json.dumps(update_data),
-                         content_type='application/json')
+    assert response.status_code == 201
+    return loads(response.data)['event_id']
+
+
+@pytest.mark.parametrize("field,new_value", [
+    ('name', 'Updated Name'),
+    ('location', 'Updated Location'),
+    ('date', '2025-01-15'),
+    ('category', 'Corporate'),
+])
+def test_update_individual_fields(client, base_event, field, new_value):
+    """
+    Test updating each field individually to ensure each field can be updated independently.
     
-    assert response.status_code == 200
-    response_data = json.loads(response.data)
-    assert response_data['event']['date'] == '2025-01-15'
+    Requirements: 5.1, 5.2, 5.3, 5.4, 5.5
+    """
+    # Send the original values with only this field changed, so each case
+    # is independent of the order the others ran in
+    update_data = {
+        'name': BASE_EVENT_DATA['eventName'],
+        'location': BASE_EVENT_DATA['eventLocation'],
+        'date': BASE_EVENT_DATA['eventDate'],
+        'category': BASE_EVENT_DATA['eventCategory'],
+        field: new_value
+    }
     
-    # Test updating category only
-    update_data['category'] = 'Corporate'
-    response = client.put(f'/api/events/{event_id}',
-                         data=json.dumps(update_data),
-                         content_type='application/json')
+    response = client.put(f'/api/events/{base_event}',
+                         json=update_data)
     
     assert response.status_code == 200
-    response_data = json.loads(response.data)
-    assert response_data['event']['category'] == 'Corporate'
-
+    response_data = loads(response.data)
+    assert response_data['event'][field] == new_value
 
 
-def test_update_multiple_fields_in_combination(client):
+def test_update_multiple_fields_in_combination(client, base_event):
     """
     Test updating multiple fields at once to ensure combined updates work correctly.
     
     Requirements: 5.1, 5.2, 5.3, 5.4, 5.5
     """
-    # Create an event
-    event_data = {
-        'eventName': 'Original Name',
-        'eventLocation': 'Original Location',
-        'eventDate': '2024-12-25',
-        'eventCategory': 'Festival'
-    }
-    
-    response = client.post('/api/create_event',
-                          data=json.dumps(event_data),
-                          content_type='application/json')
-    
-    assert response.status_code == 201
-    response_data = json.loads(response.data)
-    event_id = response_data['event_id']
-    
     # Update all fields at once
     update_data = {
         'name': 'Completely New Name',
@@ -230,12 +301,11 @@ def test_update_multiple_fields_in_combination(client):
         'category': 'Wedding'
     }
     
-    response = client.put(f'/api/events/{event_id}',
-                         data=json.dumps(update_data),
-                         content_type='application/json')
+    response = client.put(f'/api/events/{base_event}',
+                         json=update_data)
     
     assert response.status_code == 200
-    response_data = json.loads(response.data)
+    response_data = loads(response.data)
     
     # Verify all fields were updated
     assert response_data['event']['name'] == update_data['name']
@@ -244,50 +314,34 @@ def test_update_multiple_fields_in_combination(client):
     assert response_data['event']['category'] == update_data['category']
 
 
-def test_changes_reflect_immediately_on_event_organizer_dashboard(client):
+def test_updated_event_details_visible_via_events_api(client, base_event):
     """
-    Test that changes are immediately reflected in the /events API endpoint,
-    which is used by the event organizer dashboard.
+    Test that updated event details are immediately returned by the /events API.
+    
+    The event organizer dashboard, homepage carousel, event discovery page and
+    event detail page all read events from this endpoint.
     
     Requirements: 5.1, 5.2, 5.3, 5.4, 5.5
     """
-    # Create an event
-    event_data = {
-        'eventName': 'Dashboard Test Event',
-        'eventLocation': 'Dashboard Location',
-        'eventDate': '2024-12-25',
-        'eventCategory': 'Festival'
-    }
-    
-    response = client.post('/api/create_event',
-                          data=json.dumps(event_data),
-                          content_type='application/json')
-    
-    assert response.status_code == 201
-    response_data = json.loads(response.data)
-    event_id = response_data['event_id']
-    
     # Update the event
     update_data = {
-        'name': 'Updated Dashboard Event',
-        'location': 'Updated Dashboard Location',
-        'date': '2025-01-01',
-        'category': 'Corporate'
+        'name': 'Updated Visible Event',
+        'location': 'Updated Visible Location',
+        'date': '2025-04-15',
+        'category': 'Other'
     }
     
-    response = client.put(f'/api/events/{event_id}',
-                         data=json.dumps(update_data),
-                         content_type='application/json')
+    response = client.put(f'/api/events/{base_event}',
+                         json=update_data)
     
     assert response.status_code == 200
     
     # Immediately fetch events to verify changes are reflected
     response = client.get('/events')
     assert response.status_code == 200
-    events = json.loads(response.data)
+    events = _by_id(response)
     
-    # Find the updated event
-    event = next((e for e in events if e['id'] == event_id), None)
+    event = events.get(base_event)
     assert event is not None, "Event should be returned by /events API"
     
     # Verify all updated fields are immediately reflected
@@ -295,211 +349,61 @@ def test_changes_reflect_immediately_on_event_organizer_dashboard(client):
     assert event['location'] == update_data['location']
     assert event['date'] == update_data['date']
     assert event['category'] == update_data['category']
-
-
-
-def test_updated_event_details_display_on_homepage(client):
-    """
-    Test that updated event details are correctly returned by the /events API,
-    which is used by the homepage carousel.
-    
-    Requirements: 5.1, 5.2, 5.3, 5.4, 5.5
-    """
-    # Create an event
-    event_data = {
-        'eventName': 'Homepage Test Event',
-        'eventLocation': 'Homepage Location',
-        'eventDate': '2024-12-25',
-        'eventCategory': 'Festival'
-    }
-    
-    response = client.post('/api/create_event',
-                          data=json.dumps(event_data),
-                          content_type='application/json')
-    
-    assert response.status_code == 201
-    response_data = json.loads(response.data)
-    event_id = response_data['event_id']
-    
-    # Update the event
-    update_data = {
-        'name': 'Updated Homepage Event',
-        'location': 'Updated Homepage Location',
-        'date': '2025-02-14',
-        'category': 'Wedding'
-    }
-    
-    response = client.put(f'/api/events/{event_id}',
-                         data=json.dumps(update_data),
-                         content_type='application/json')
-    
-    assert response.status_code == 200
-    
-    # Fetch events (as the homepage would)
-    response = client.get('/events')
-    assert response.status_code == 200
-    events = json.loads(response.data)
-    
-    # Find the updated event
-    event = next((e for e in events if e['id'] == event_id), None)
-    assert event is not None, "Event should be available for homepage display"
-    
-    # Verify updated details are correct for homepage display
-    assert event['name'] == update_data['name']
-    assert event['location'] == update_data['location']
-    assert event['date'] == update_data['date']
-    assert event['category'] == update_data['category']
     assert 'image' in event  # Thumbnail should be available
+    assert 'qr_code' in event  # QR code should be available
 
 
-def test_updated_event_details_display_on_event_discovery(client):
-    """
-    Test that updated event details are correctly returned by the /events API,
-    which is used by the event discovery page.
-    
-    Requirements: 5.1, 5.2, 5.3, 5.4, 5.5
-    """
-    # Create an event
-    event_data = {
-        'eventName': 'Discovery Test Event',
-        'eventLocation': 'Discovery Location',
-        'eventDate': '2024-12-25',
-        'eventCategory': 'Conference'
+def seed_events(events):
+    """Append event records straight to the events file, bypassing the API"""
+    with open(app_module.EVENTS_DATA_PATH, 'r') as f:
+        events_data = json.load(f)
+    
+    events_data.extend(events)
+    
+    with open(app_module.EVENTS_DATA_PATH, 'w') as f:
+        json.dump(events_data, f, indent=2)
+
+
+def seeded_event(event_id, name, location, date, category):
+    """Build an event record as create_event stores it, owned by admin 1"""
+    return {
+        "id": event_id,
+        "name": name,
+        "location": location,
+        "date": date,
+        "category": category,
+        "image": "/static/images/default_event.jpg",
+        "thumbnail_filename": None,
+        "photos_count": 0,
+        "qr_code": f"/api/qr_code/{event_id}",
+        "created_by_admin_id": 1,
+        "created_by_user_id": None,
+        "created_at": "2024-12-01T10:00:00",
+        "sample_photos": []
     }
-    
-    response = client.post('/api/create_event',
-                          data=json.dumps(event_data),
-                          content_type='application/json')
-    
-    assert response.status_code == 201
-    response_data = json.loads(response.data)
-    event_id = response_data['event_id']
-    
-    # Update the event
-    update_data = {
-        'name': 'Updated Discovery Event',
-        'location': 'Updated Discovery Location',
-        'date': '2025-03-20',
-        'category': 'Sports'
-    }
-    
-    response = client.put(f'/api/events/{event_id}',
-                         data=json.dumps(update_data),
-                         content_type='application/json')
-    
-    assert response.status_code == 200
-    
-    # Fetch events (as the discovery page would)
-    response = client.get('/events')
-    assert response.status_code == 200
-    events = json.loads(response.data)
-    
-    # Find the updated event
-    event = next((e for e in events if e['id'] == event_id), None)
-    assert event is not None, "Event should be available for discovery page"
-    
-    # Verify updated details are correct for discovery page display
-    assert event['name'] == update_data['name']
-    assert event['location'] == update_data['location']
-    assert event['date'] == update_data['date']
-    assert event['category'] == update_data['category']
-    assert 'image' in event  # Thumbnail should be available
 
 
-
-def test_updated_event_details_display_on_event_detail_page(client):
-    """
-    Test that updated event details are correctly returned by the /events API,
-    which is used by the event detail page.
-    
-    Requirements: 5.1, 5.2, 5.3, 5.4, 5.5
-    """
-    # Create an event
-    event_data = {
-        'eventName': 'Detail Page Test Event',
-        'eventLocation': 'Detail Location',
-        'eventDate': '2024-12-25',
-        'eventCategory': 'Party'
-    }
-    
-    response = client.post('/api/create_event',
-                          data=json.dumps(event_data),
-                          content_type='application/json')
-    
-    assert response.status_code == 201
-    response_data = json.loads(response.data)
-    event_id = response_data['event_id']
-    
-    # Update the event
-    update_data = {
-        'name': 'Updated Detail Event',
-        'location': 'Updated Detail Location',
-        'date': '2025-04-15',
-        'category': 'Other'
-    }
-    
-    response = client.put(f'/api/events/{event_id}',
-                         data=json.dumps(update_data),
-                         content_type='application/json')
-    
-    assert response.status_code == 200
-    
-    # Fetch events (as the detail page would)
-    response = client.get('/events')
-    assert response.status_code == 200
-    events = json.loads(response.data)
-    
-    # Find the updated event
-    event = next((e for e in events if e['id'] == event_id), None)
-    assert event is not None, "Event should be available for detail page"
+@pytest.fixture(scope="module")
+def three_events(client):
+    """Seed three events once per module and return their IDs"""
+    events = [
+        seeded_event('event_seed0001', 'Event 1', 'Location 1', '2024-12-25', 'Festival'),
+        seeded_event('event_seed0002', 'Event 2', 'Location 2', '2025-01-15', 'Corporate'),
+        seeded_event('event_seed0003', 'Event 3', 'Location 3', '2025-02-20', 'Wedding')
+    ]
+    seed_events(events)
     
-    # Verify updated details are correct for detail page display
-    assert event['name'] == update_data['name']
-    assert event['location'] == update_data['location']
-    assert event['date'] == update_data['date']
-    assert event['category'] == update_data['category']
-    assert 'image' in event  # Thumbnail should be available
-    assert 'qr_code' in event  # QR code should be available
+    return [event['id'] for event in events]
 
 
-def test_multiple_events_correct_event_edited(client):
+def test_multiple_events_correct_event_edited(client, three_events):
     """
     Test with multiple events to ensure the correct event is being edited
     and other events remain unchanged.
     
     Requirements: 5.1, 5.2, 5.3, 5.4, 5.5
     """
-    # Create multiple events
-    events_data = [
-        {
-            'eventName': 'Event 1',
-            'eventLocation': 'Location 1',
-            'eventDate': '2024-12-25',
-            'eventCategory': 'Festival'
-        },
-        {
-            'eventName': 'Event 2',
-            'eventLocation': 'Location 2',
-            'eventDate': '2025-01-15',
-            'eventCategory': 'Corporate'
-        },
-        {
-            'eventName': 'Event 3',
-            'eventLocation': 'Location 3',
-            'eventDate': '2025-02-20',
-            'eventCategory': 'Wedding'
-        }
-    ]
-    
-    event_ids = []
-    for event_data in events_data:
-        response = client.post('/api/create_event',
-                              data=json.dumps(event_data),
-                              content_type='application/json')
-        
-        assert response.status_code == 201
-        response_data = json.loads(response.data)
-        event_ids.append(response_data['event_id'])
+    event_ids = three_events
     
     # Update only the second event
     update_data = {
@@ -510,20 +414,19 @@ def test_multiple_events_correct_event_edited(client):
     }
     
     response = client.put(f'/api/events/{event_ids[1]}',
-                         data=json.dumps(update_data),
-                         content_type='application/json')
+                         json=update_data)
     
     assert response.status_code == 200
     
     # Fetch all events
     response = client.get('/events')
     assert response.status_code == 200
-    events = json.loads(response.data)
+    events = _by_id(response)
     
     # Find all three events
-    event1 = next((e for e in events if e['id'] == event_ids[0]), None)
-    event2 = next((e for e in events if e['id'] == event_ids[1]), None)
-    event3 = next((e for e in events if e['id'] == event_ids[2]), None)
+    event1 = events.get(event_ids[0])
+    event2 = events.get(event_ids[1])
+    event3 = events.get(event_ids[2])
     
     assert event1 is not None
     assert event2 is not None
@@ -547,6 +450,52 @@ def test_multiple_events_correct_event_edited(client):
 
 
 
+def test_get_single_event_by_id(client, three_events):
+    """
+    Test that GET /api/events/<id> returns just that event, and 404 for an
+    unknown ID.
+    """
+    event = fetch_event(client, three_events[2])
+    assert event is not None
+    assert event['id'] == three_events[2]
+    assert event['name'] == 'Event 3'
+    
+    response = client.get('/api/events/event_missing')
+    assert response.status_code == 404
+    assert loads(response.data)['success'] is False
+
+
+def test_events_listing_reflects_direct_file_writes(client):
+    """
+    Test that /events picks up an events file written outside the API, even
+    right after a listing of the previous contents was served.
+    """
+    before = _by_id(client.get('/events'))
+    assert _by_id(client.get('/events')) == before
+    
+    seed_events([seeded_event('event_direct01', 'Direct Event', 'Direct Location', '2025-05-01', 'Other')])
+    
+    after = _by_id(client.get('/events'))
+    assert after.keys() == before.keys() | {'event_direct01'}
+    assert after['event_direct01']['name'] == 'Direct Event'
+
+
+def test_events_listing_serves_files_orjson_rejects(client):
+    """
+    Test that /events still lists an events file that only the stdlib json
+    module can parse (here a bare Infinity, as json.dump writes for inf).
+    """
+    event = seeded_event('event_inf00001', 'Infinity Event', 'Location', '2025-05-01', 'Other')
+    event['photos_count'] = float('inf')
+    seed_events([event])
+    
+    response = client.get('/events')
+    assert response.status_code == 200
+    # loads() may be orjson, which can't read the Infinity literal either
+    events = {e['id']: e for e in response.get_json()}
+    assert events['event_inf00001']['photos_count'] == float('inf')
+
+
 def test_edit_with_thumbnail_update_across_pages(client):
     """
     Test that thumbnail updates are reflected across all pages.
@@ -566,7 +515,7 @@ def test_edit_with_thumbnail_update_across_pages(client):
     
     response = client.post('/api/create_event', data=event_data, content_type='multipart/form-data')
     assert response.status_code == 201
-    response_data = json.loads(response.data)
+    response_data = loads(response.data)
     event_id = response_data['event_id']
     
     # Update event details
@@ -578,8 +527,7 @@ def test_edit_with_thumbnail_update_across_pages(client):
     }
     
     response = client.put(f'/api/events/{event_id}',
-                         data=json.dumps(update_data),
-                         content_type='application/json')
+                         json=update_data)
     
     assert response.status_code == 200
     
@@ -598,10 +546,10 @@ def test_edit_with_thumbnail_update_across_pages(client):
     # Fetch events to verify both details and thumbnail are updated
     response = client.get('/events')
     assert response.status_code == 200
-    events = json.loads(response.data)
+    events = _by_id(response)
     
     # Find the updated event
-    event = next((e for e in events if e['id'] == event_id), None)
+    event = events.get(event_id)
     assert event is not None
     
     # Verify updated details
@@ -644,18 +592,14 @@ def test_create_event_with_thumbnail(client):
     response = client.post('/api/create_event', data=event_data, content_type='multipart/form-data')
     
     assert response.status_code == 201
-    response_data = json.loads(response.data)
+    response_data = loads(response.data)
     assert response_data['success'] is True
     assert 'event_id' in response_data
     
     event_id = response_data['event_id']
     
     # Verify event was created with thumbnail
-    response = client.get('/events')
-    assert response.status_code == 200
-    events = json.loads(response.data)
-    
-    event = next((e for e in events if e['id'] == event_id), None)
+    event = fetch_event(client, event_id)
     assert event is not None
     assert event['image'] == f"/api/events/{event_id}/thumbnail"
     assert event['thumbnail_filename'] is not None
@@ -682,11 +626,10 @@ def test_create_event_without_thumbnail_uses_default(client):
     
     # Create event without thumbnail (JSON format)
     response = client.post('/api/create_event',
-                          data=json.dumps(event_data),
-                          content_type='application/json')
+                          json=event_data)
     
     assert response.status_code == 201
-    response_data = json.loads(response.data)
+    response_data = loads(response.data)
     assert response_data['success'] is True
     
     event_id = response_data['event_id']
@@ -694,9 +637,9 @@ def test_create_event_without_thumbnail_uses_default(client):
     # Verify event uses default thumbnail
     response = client.get('/events')
     assert response.status_code == 200
-    events = json.loads(response.data)
+    events = _by_id(response)
     
-    event = next((e for e in events if e['id'] == event_id), None)
+    event = events.get(event_id)
     assert event is not None
     assert event['image'] == '/static/images/default_event.jpg'
     assert event['thumbnail_filename'] is None
@@ -721,13 +664,11 @@ def test_change_thumbnail_on_existing_event(client):
     
     response = client.post('/api/create_event', data=event_data, content_type='multipart/form-data')
     assert response.status_code == 201
-    response_data = json.loads(response.data)
+    response_data = loads(response.data)
     event_id = response_data['event_id']
     
     # Get initial thumbnail filename
-    response = client.get('/events')
-    events = json.loads(response.data)
-    event = next((e for e in events if e['id'] == event_id), None)
+    event = fetch_event(client, event_id)
     initial_thumbnail_filename = event['thumbnail_filename']
     
     # Change thumbnail
@@ -741,14 +682,12 @@ def test_change_thumbnail_on_existing_event(client):
                           content_type='multipart/form-data')
     
     assert response.status_code == 200
-    response_data = json.loads(response.data)
+    response_data = loads(response.data)
     assert response_data['success'] is True
     assert response_data['thumbnail_url'] == f"/api/events/{event_id}/thumbnail"
     
     # Verify new thumbnail is in place
-    response = client.get('/events')
-    events = json.loads(response.data)
-    event = next((e for e in events if e['id'] == event_id), None)
+    event = fetch_event(client, event_id)
     
     new_thumbnail_filename = event['thumbnail_filename']
     assert new_thumbnail_filename != initial_thumbnail_filename
@@ -779,24 +718,18 @@ def test_old_thumbnail_deleted_after_replacement(client):
     
     response = client.post('/api/create_event', data=event_data, content_type='multipart/form-data')
     assert response.status_code == 201
-    response_data = json.loads(response.data)
+    response_data = loads(response.data)
     event_id = response_data['event_id']
     
     # Get initial thumbnail filename
-    response = client.get('/events')
-    events = json.loads(response.data)
-    event = next((e for e in events if e['id'] == event_id), None)
+    event = fetch_event(client, event_id)
     initial_thumbnail_filename = event['thumbnail_filename']
     
     # Construct path to old thumbnail
-    old_thumbnail_path = os.path.join(
-        client.application.config['UPLOAD_FOLDER'],
-        event_id,
-        initial_thumbnail_filename
-    )
+    old_thumbnail_path = thumbnail_path(client, event_id, initial_thumbnail_filename)
     
     # Verify old thumbnail exists
-    assert os.path.exists(old_thumbnail_path), "Initial thumbnail should exist"
+    assert os.stat(old_thumbnail_path).st_size > 0, "Initial thumbnail should exist"
     
     # Upload new thumbnail
     img_data2 = create_test_image(format='JPEG')
@@ -814,18 +747,12 @@ def test_old_thumbnail_deleted_after_replacement(client):
     assert not os.path.exists(old_thumbnail_path), "Old thumbnail should be deleted"
     
     # Verify new thumbnail exists
-    response = client.get('/events')
-    events = json.loads(response.data)
-    event = next((e for e in events if e['id'] == event_id), None)
+    event = fetch_event(client, event_id)
     new_thumbnail_filename = event['thumbnail_filename']
     
-    new_thumbnail_path = os.path.join(
-        client.application.config['UPLOAD_FOLDER'],
-        event_id,
-        new_thumbnail_filename
-    )
+    new_thumbnail_path = thumbnail_path(client, event_id, new_thumbnail_filename)
     
-    assert os.path.exists(new_thumbnail_path), "New thumbnail should exist"
+    assert os.stat(new_thumbnail_path).st_size > 0, "New thumbnail should exist"
 
 
 def test_thumbnail_display_on_all_pages(client):
@@ -848,15 +775,15 @@ def test_thumbnail_display_on_all_pages(client):
     
     response = client.post('/api/create_event', data=event_data, content_type='multipart/form-data')
     assert response.status_code == 201
-    response_data = json.loads(response.data)
+    response_data = loads(response.data)
     event_id = response_data['event_id']
     
     # Fetch events (used by all pages: homepage, discovery, detail, organizer)
     response = client.get('/events')
     assert response.status_code == 200
-    events = json.loads(response.data)
+    events = _by_id(response)
     
-    event = next((e for e in events if e['id'] == event_id), None)
+    event = events.get(event_id)
     assert event is not None
     
     # Verify thumbnail path is present and correct
@@ -872,114 +799,113 @@ def test_thumbnail_display_on_all_pages(client):
     assert len(response.data) > 0
 
 
-def test_various_image_formats_png(client):
+@pytest.mark.parametrize("fmt,filename,mimetype,served_types", [
+    ('PNG', 'test.png', 'image/png', ['image/png', 'image/x-png']),
+    ('JPG', 'test.jpg', 'image/jpeg', ['image/jpeg', 'image/jpg']),
+    ('JPEG', 'test.jpeg', 'image/jpeg', ['image/jpeg', 'image/jpg']),
+])
+def test_various_image_formats(client, fmt, filename, mimetype, served_types):
     """
-    Test uploading PNG format thumbnails.
+    Test uploading PNG, JPG and JPEG format thumbnails.
     
     Requirements: 2.2
     """
-    img_data = create_test_image(format='PNG')
+    img_data = create_test_image(format=fmt)
     
     event_data = {
-        'eventName': 'PNG Format Test',
+        'eventName': f'{fmt} Format Test',
         'eventLocation': 'Test Location',
         'eventDate': '2024-12-25',
         'eventCategory': 'Festival',
-        'thumbnail': (img_data, 'test.png', 'image/png')
+        'thumbnail': (img_data, filename, mimetype)
     }
     
     response = client.post('/api/create_event', data=event_data, content_type='multipart/form-data')
     
     assert response.status_code == 201
-    response_data = json.loads(response.data)
+    response_data = loads(response.data)
     event_id = response_data['event_id']
     
     # Verify thumbnail is servable
     response = client.get(f'/api/events/{event_id}/thumbnail')
     assert response.status_code == 200
-    assert response.content_type in ['image/png', 'image/x-png']
+    assert response.content_type in served_types
 
 
-def test_various_image_formats_jpg(client):
+def test_invalid_file_type_rejection_on_create(client):
     """
-    Test uploading JPG format thumbnails.
+    Test that invalid file types are rejected during event creation.
     
     Requirements: 2.2
     """
-    img_data = create_test_image(format='JPG')
+    # Create a fake text file pretending to be an image
+    fake_file = BytesIO(b"This is not an image")
     
     event_data = {
-        'eventName': 'JPG Format Test',
+        'eventName': 'Invalid File Test',
         'eventLocation': 'Test Location',
         'eventDate': '2024-12-25',
-        'eventCategory': 'Corporate',
-        'thumbnail': (img_data, 'test.jpg', 'image/jpeg')
+        'eventCategory': 'Festival',
+        'thumbnail': (fake_file, 'test.txt', 'text/plain')
     }
     
     response = client.post('/api/create_event', data=event_data, content_type='multipart/form-data')
     
-    assert response.status_code == 201
-    response_data = json.loads(response.data)
-    event_id = response_data['event_id']
-    
-    # Verify thumbnail is servable
-    response = client.get(f'/api/events/{event_id}/thumbnail')
-    assert response.status_code == 200
-    assert response.content_type in ['image/jpeg', 'image/jpg']
+    # Should reject invalid file type
+    assert response.status_code == 400
+    response_data = loads(response.data)
+    assert response_data['success'] is False
+    assert 'Invalid file type' in response_data['error']
 
 
-def test_various_image_formats_jpeg(client):
+def test_oversized_thumbnail_rejected(client, base_event):
     """
-    Test uploading JPEG format thumbnails.
-    
-    Requirements: 2.2
+    Test that a thumbnail upload larger than the 5MB limit is rejected on
+    create and on update.
     """
-    img_data = create_test_image(format='JPEG')
+    oversized = b'\x89PNG' + b'\0' * (6 * 1024 * 1024)
     
-    event_data = {
-        'eventName': 'JPEG Format Test',
+    response = client.post('/api/create_event', data={
+        'eventName': 'Oversized Thumbnail Event',
         'eventLocation': 'Test Location',
         'eventDate': '2024-12-25',
-        'eventCategory': 'Wedding',
-        'thumbnail': (img_data, 'test.jpeg', 'image/jpeg')
-    }
+        'eventCategory': 'Festival',
+        'thumbnail': (BytesIO(oversized), 'huge.png', 'image/png')
+    }, content_type='multipart/form-data')
     
-    response = client.post('/api/create_event', data=event_data, content_type='multipart/form-data')
+    assert response.status_code == 400
+    assert 'too large' in loads(response.data)['error']
     
-    assert response.status_code == 201
-    response_data = json.loads(response.data)
-    event_id = response_data['event_id']
+    response = client.post(f'/api/events/{base_event}/thumbnail', data={
+        'thumbnail': (BytesIO(oversized), 'huge.png', 'image/png')
+    }, content_type='multipart/form-data')
     
-    # Verify thumbnail is servable
-    response = client.get(f'/api/events/{event_id}/thumbnail')
-    assert response.status_code == 200
-    assert response.content_type in ['image/jpeg', 'image/jpg']
+    assert response.status_code == 400
+    assert 'too large' in loads(response.data)['error']
 
 
-def test_invalid_file_type_rejection_on_create(client):
+def test_thumbnail_content_must_match_image_type(client, base_event):
     """
-    Test that invalid file types are rejected during event creation.
-    
-    Requirements: 2.2
+    Test that a file with an image extension but non-image content is
+    rejected on create and on update.
     """
-    # Create a fake text file pretending to be an image
-    fake_file = BytesIO(b"This is not an image")
-    
-    event_data = {
-        'eventName': 'Invalid File Test',
+    response = client.post('/api/create_event', data={
+        'eventName': 'Disguised Thumbnail Event',
         'eventLocation': 'Test Location',
         'eventDate': '2024-12-25',
         'eventCategory': 'Festival',
-        'thumbnail': (fake_file, 'test.txt', 'text/plain')
-    }
+        'thumbnail': (BytesIO(b"This is not an image"), 'disguised.png', 'image/png')
+    }, content_type='multipart/form-data')
     
-    response = client.post('/api/create_event', data=event_data, content_type='multipart/form-data')
+    assert response.status_code == 400
+    assert 'does not match' in loads(response.data)['error']
+    
+    response = client.post(f'/api/events/{base_event}/thumbnail', data={
+        'thumbnail': (BytesIO(b"This is not an image"), 'disguised.jpg', 'image/jpeg')
+    }, content_type='multipart/form-data')
     
-    # Should reject invalid file type
     assert response.status_code == 400
-    response_data = json.loads(response.data)
-    assert response_data['success'] is False
-    assert 'Invalid file type' in response_data['error']
+    assert 'does not match' in loads(response.data)['error']
 
 
 def test_invalid_file_type_rejection_on_update(client):
@@ -1001,7 +927,7 @@ def test_invalid_file_type_rejection_on_update(client):
     
     response = client.post('/api/create_event', data=event_data, content_type='multipart/form-data')
     assert response.status_code == 201
-    response_data = json.loads(response.data)
+    response_data = loads(response.data)
     event_id = response_data['event_id']
     
     # Try to update with invalid file type
@@ -1017,7 +943,7 @@ def test_invalid_file_type_rejection_on_update(client):
     
     # Should reject invalid file type
     assert response.status_code == 400
-    response_data = json.loads(response.data)
+    response_data = loads(response.data)
     assert response_data['success'] is False
     assert 'Invalid file type' in response_data['error']
 
@@ -1046,12 +972,10 @@ def test_thumbnail_functionality_comprehensive_workflow(client):
     
     response = client.post('/api/create_event', data=event_data, content_type='multipart/form-data')
     assert response.status_code == 201
-    event_id = json.loads(response.data)['event_id']
+    event_id = loads(response.data)['event_id']
     
     # Step 2: Verify initial thumbnail displays
-    response = client.get('/events')
-    events = json.loads(response.data)
-    event = next((e for e in events if e['id'] == event_id), None)
+    event = fetch_event(client, event_id)
     
     assert event['image'] == f"/api/events/{event_id}/thumbnail"
     initial_filename = event['thumbnail_filename']
@@ -1060,6 +984,11 @@ def test_thumbnail_functionality_comprehensive_workflow(client):
     
     response = client.get(event['image'])
     assert response.status_code == 200
+    initial_etag = response.headers['ETag']
+    
+    # Revalidating an unchanged thumbnail is answered without the body
+    response = client.get(event['image'], headers={'If-None-Match': initial_etag})
+    assert response.status_code == 304
     
     # Step 3: Update to JPEG thumbnail
     img_jpeg = create_test_image(format='JPEG')
@@ -1073,9 +1002,7 @@ def test_thumbnail_functionality_comprehensive_workflow(client):
     assert response.status_code == 200
     
     # Step 4: Verify old deleted, new displays
-    response = client.get('/events')
-    events = json.loads(response.data)
-    event = next((e for e in events if e['id'] == event_id), None)
+    event = fetch_event(client, event_id)
     
     new_filename = event['thumbnail_filename']
     assert new_filename != initial_filename
@@ -1083,11 +1010,7 @@ def test_thumbnail_functionality_comprehensive_workflow(client):
     assert new_filename.endswith('.jpeg')
     
     # Verify old file deleted (may fail on Windows due to file locking)
-    old_path = os.path.join(
-        client.application.config['UPLOAD_FOLDER'],
-        event_id,
-        initial_filename
-    )
+    old_path = thumbnail_path(client, event_id, initial_filename)
     # On Windows, file may still be locked, so we check if deletion was attempted
     # The important thing is that the new filename is different
     try:
@@ -1098,14 +1021,11 @@ def test_thumbnail_functionality_comprehensive_workflow(client):
         pass
     
     # Verify new file exists and is servable
-    new_path = os.path.join(
-        client.application.config['UPLOAD_FOLDER'],
-        event_id,
-        new_filename
-    )
-    assert os.path.exists(new_path)
+    new_path = thumbnail_path(client, event_id, new_filename)
+    assert os.stat(new_path).st_size > 0
     
-    response = client.get(event['image'])
+    # Same URL, new file: the old ETag must not match
+    response = client.get(event['image'], headers={'If-None-Match': initial_etag})
     assert response.status_code == 200
     assert response.content_type.startswith('image/')
     
@@ -1121,9 +1041,7 @@ def test_thumbnail_functionality_comprehensive_workflow(client):
     assert response.status_code == 200
     
     # Verify final state
-    response = client.get('/events')
-    events = json.loads(response.data)
-    event = next((e for e in events if e['id'] == event_id), None)
+    event = fetch_event(client, event_id)
     
     final_filename = event['thumbnail_filename']
     assert final_filename.startswith('thumbnail_')
@@ -1137,92 +1055,58 @@ def test_thumbnail_functionality_comprehensive_workflow(client):
 # Authorization and security tests (Task 12)
 # ============================================================================
 
-def test_non_authenticated_user_cannot_update_event_details(client):
-    """
-    Test that non-authenticated users cannot access the update event endpoint.
-    
-    Requirements: 6.1
-    """
-    # Create an event with authenticated session
-    event_data = {
-        'eventName': 'Test Event',
-        'eventLocation': 'Test Location',
-        'eventDate': '2024-12-25',
-        'eventCategory': 'Festival'
-    }
-    
-    response = client.post('/api/create_event',
-                          data=json.dumps(event_data),
-                          content_type='application/json')
-    
-    assert response.status_code == 201
-    response_data = json.loads(response.data)
-    event_id = response_data['event_id']
-    
-    # Clear session to simulate non-authenticated user
-    with client.session_transaction() as sess:
-        sess.clear()
-    
-    # Try to update event without authentication
-    update_data = {
+def _clear_session(sess):
+    """Non-authenticated user, or an admin whose session expired"""
+    sess.clear()
+
+
+def _drop_admin_id(sess):
+    """Incomplete session: logged in, but with no admin_id"""
+    sess['admin_logged_in'] = True
+    sess.pop('admin_id', None)
+
+
+def _put_event_details(client, event_id):
+    return client.put(f'/api/events/{event_id}', json={
         'name': 'Updated Name',
         'location': 'Updated Location',
         'date': '2025-01-01',
         'category': 'Corporate'
-    }
-    
-    response = client.put(f'/api/events/{event_id}',
-                         data=json.dumps(update_data),
-                         content_type='application/json')
-    
-    # Should return 401 Unauthorized
-    assert response.status_code == 401
-    response_data = json.loads(response.data)
-    assert response_data['success'] is False
-    assert 'Unauthorized' in response_data['error']
-
-
-def test_non_authenticated_user_cannot_update_thumbnail(client):
+    })
+
+
+def _post_event_thumbnail(client, event_id):
+    return client.post(f'/api/events/{event_id}/thumbnail',
+                      data={'thumbnail': (create_test_image(format='JPEG'), 'new.jpg', 'image/jpeg')},
+                      content_type='multipart/form-data')
+
+
+@pytest.mark.parametrize("mutate_session,send_update,expected_status,expected_error", [
+    pytest.param(_clear_session, _put_event_details, 401, 'Unauthorized',
+                 id='no-session-details'),
+    pytest.param(_clear_session, _post_event_thumbnail, 401, 'Unauthorized',
+                 id='no-session-thumbnail'),
+    # The ownership check compares the event's admin ID with None
+    pytest.param(_drop_admin_id, _put_event_details, 403, 'You can only edit events you created',
+                 id='missing-admin-id-details'),
+])
+def test_update_rejected_without_complete_admin_session(client, base_event, mutate_session,
+                                                        send_update, expected_status, expected_error):
     """
-    Test that non-authenticated users cannot access the thumbnail update endpoint.
+    Test that the event update endpoints reject non-authenticated users,
+    expired (cleared) sessions, and sessions missing admin_id.
     
-    Requirements: 6.1
+    Requirements: 6.1, 6.5
     """
-    # Create an event with authenticated session
-    img_data = create_test_image(format='PNG')
-    
-    event_data = {
-        'eventName': 'Test Event',
-        'eventLocation': 'Test Location',
-        'eventDate': '2024-12-25',
-        'eventCategory': 'Festival',
-        'thumbnail': (img_data, 'test.png', 'image/png')
-    }
-    
-    response = client.post('/api/create_event', data=event_data, content_type='multipart/form-data')
-    assert response.status_code == 201
-    response_data = json.loads(response.data)
-    event_id = response_data['event_id']
-    
-    # Clear session to simulate non-authenticated user
     with client.session_transaction() as sess:
-        sess.clear()
+        mutate_session(sess)
     
-    # Try to update thumbnail without authentication
-    new_img_data = create_test_image(format='JPEG')
-    thumbnail_data = {
-        'thumbnail': (new_img_data, 'new.jpg', 'image/jpeg')
-    }
+    response = send_update(client, base_event)
     
-    response = client.post(f'/api/events/{event_id}/thumbnail',
-                          data=thumbnail_data,
-                          content_type='multipart/form-data')
-    
-    # Should return 401 Unauthorized
-    assert response.status_code == 401
-    response_data = json.loads(response.data)
+    assert response.status_code == expected_status
+    response_data = loads(response.data)
     assert response_data['success'] is False
-    assert 'Unauthorized' in response_data['error']
+    assert expected_error in response_data['error']
 
 
 def test_admin_cannot_edit_other_admin_event_details(client):
@@ -1240,11 +1124,10 @@ def test_admin_cannot_edit_other_admin_event_details(client):
     }
     
     response = client.post('/api/create_event',
-                          data=json.dumps(event_data),
-                          content_type='application/json')
+                          json=event_data)
     
     assert response.status_code == 201
-    response_data = json.loads(response.data)
+    response_data = loads(response.data)
     event_id = response_data['event_id']
     
     # Switch to admin 2 session
@@ -1262,12 +1145,11 @@ def test_admin_cannot_edit_other_admin_event_details(client):
     }
     
     response = client.put(f'/api/events/{event_id}',
-                         data=json.dumps(update_data),
-                         content_type='application/json')
+                         json=update_data)
     
     # Should return 403 Forbidden
     assert response.status_code == 403
-    response_data = json.loads(response.data)
+    response_data = loads(response.data)
     assert response_data['success'] is False
     assert 'You can only edit events you created' in response_data['error']
     
@@ -1276,8 +1158,8 @@ def test_admin_cannot_edit_other_admin_event_details(client):
         sess['admin_id'] = 1  # Switch back to admin 1
     
     response = client.get('/events')
-    events = json.loads(response.data)
-    event = next((e for e in events if e['id'] == event_id), None)
+    events = _by_id(response)
+    event = events.get(event_id)
     
     assert event['name'] == 'Admin 1 Event'
     assert event['location'] == 'Test Location'
@@ -1302,13 +1184,13 @@ def test_admin_cannot_edit_other_admin_event_thumbnail(client):
     
     response = client.post('/api/create_event', data=event_data, content_type='multipart/form-data')
     assert response.status_code == 201
-    response_data = json.loads(response.data)
+    response_data = loads(response.data)
     event_id = response_data['event_id']
     
     # Get original thumbnail filename
     response = client.get('/events')
-    events = json.loads(response.data)
-    event = next((e for e in events if e['id'] == event_id), None)
+    events = _by_id(response)
+    event = events.get(event_id)
     original_thumbnail = event['thumbnail_filename']
     
     # Switch to admin 2 session
@@ -1329,7 +1211,7 @@ def test_admin_cannot_edit_other_admin_event_thumbnail(client):
     
     # Should return 403 Forbidden
     assert response.status_code == 403
-    response_data = json.loads(response.data)
+    response_data = loads(response.data)
     assert response_data['success'] is False
     assert 'You can only edit events you created' in response_data['error']
     
@@ -1338,8 +1220,8 @@ def test_admin_cannot_edit_other_admin_event_thumbnail(client):
         sess['admin_id'] = 1  # Switch back to admin 1
     
     response = client.get('/events')
-    events = json.loads(response.data)
-    event = next((e for e in events if e['id'] == event_id), None)
+    events = _by_id(response)
+    event = events.get(event_id)
     
     assert event['thumbnail_filename'] == original_thumbnail
 
@@ -1359,11 +1241,10 @@ def test_admin_can_edit_own_event_details(client):
     }
     
     response = client.post('/api/create_event',
-                          data=json.dumps(event_data),
-                          content_type='application/json')
+                          json=event_data)
     
     assert response.status_code == 201
-    response_data = json.loads(response.data)
+    response_data = loads(response.data)
     event_id = response_data['event_id']
     
     # Update event as the same admin
@@ -1375,12 +1256,11 @@ def test_admin_can_edit_own_event_details(client):
     }
     
     response = client.put(f'/api/events/{event_id}',
-                         data=json.dumps(update_data),
-                         content_type='application/json')
+                         json=update_data)
     
     # Should succeed
     assert response.status_code == 200
-    response_data = json.loads(response.data)
+    response_data = loads(response.data)
     assert response_data['success'] is True
     assert response_data['event']['name'] == 'My Updated Event'
     assert response_data['event']['location'] == 'My Updated Location'
@@ -1407,7 +1287,7 @@ def test_admin_can_edit_own_event_thumbnail(client):
     
     response = client.post('/api/create_event', data=event_data, content_type='multipart/form-data')
     assert response.status_code == 201
-    response_data = json.loads(response.data)
+    response_data = loads(response.data)
     event_id = response_data['event_id']
     
     # Update thumbnail as the same admin
@@ -1422,109 +1302,19 @@ def test_admin_can_edit_own_event_thumbnail(client):
     
     # Should succeed
     assert response.status_code == 200
-    response_data = json.loads(response.data)
+    response_data = loads(response.data)
     assert response_data['success'] is True
     assert response_data['thumbnail_url'] == f"/api/events/{event_id}/thumbnail"
     
     # Verify thumbnail was updated
     response = client.get('/events')
-    events = json.loads(response.data)
-    event = next((e for e in events if e['id'] == event_id), None)
+    events = _by_id(response)
+    event = events.get(event_id)
     
     assert event['thumbnail_filename'].endswith('.jpg')
     assert event['image'] == f"/api/events/{event_id}/thumbnail"
 
 
-def test_session_expiration_rejects_edit_requests(client):
-    """
-    Test that expired/cleared sessions are rejected when attempting to edit.
-    This simulates session expiration handling.
-    
-    Requirements: 6.5
-    """
-    # Create an event with authenticated session
-    event_data = {
-        'eventName': 'Test Event',
-        'eventLocation': 'Test Location',
-        'eventDate': '2024-12-25',
-        'eventCategory': 'Festival'
-    }
-    
-    response = client.post('/api/create_event',
-                          data=json.dumps(event_data),
-                          content_type='application/json')
-    
-    assert response.status_code == 201
-    response_data = json.loads(response.data)
-    event_id = response_data['event_id']
-    
-    # Simulate session expiration by clearing the session
-    with client.session_transaction() as sess:
-        sess.clear()
-    
-    # Try to update event with expired session
-    update_data = {
-        'name': 'Updated Name',
-        'location': 'Updated Location',
-        'date': '2025-01-01',
-        'category': 'Corporate'
-    }
-    
-    response = client.put(f'/api/events/{event_id}',
-                         data=json.dumps(update_data),
-                         content_type='application/json')
-    
-    # Should return 401 Unauthorized (session expired)
-    assert response.status_code == 401
-    response_data = json.loads(response.data)
-    assert response_data['success'] is False
-    assert 'Unauthorized' in response_data['error']
-
-
-def test_session_expiration_rejects_thumbnail_update(client):
-    """
-    Test that expired/cleared sessions are rejected when attempting to update thumbnails.
-    This simulates session expiration handling.
-    
-    Requirements: 6.5
-    """
-    # Create an event with authenticated session
-    img_data = create_test_image(format='PNG')
-    
-    event_data = {
-        'eventName': 'Test Event',
-        'eventLocation': 'Test Location',
-        'eventDate': '2024-12-25',
-        'eventCategory': 'Festival',
-        'thumbnail': (img_data, 'test.png', 'image/png')
-    }
-    
-    response = client.post('/api/create_event', data=event_data, content_type='multipart/form-data')
-    assert response.status_code == 201
-    response_data = json.loads(response.data)
-    event_id = response_data['event_id']
-    
-    # Simulate session expiration by clearing the session
-    with client.session_transaction() as sess:
-        sess.clear()
-    
-    # Try to update thumbnail with expired session
-    new_img_data = create_test_image(format='JPEG')
-    thumbnail_data = {
-        'thumbnail': (new_img_data, 'new.jpg', 'image/jpeg')
-    }
-    
-    response = client.post(f'/api/events/{event_id}/thumbnail',
-                          data=thumbnail_data,
-                          content_type='multipart/form-data')
-    
-    # Should return 401 Unauthorized (session expired)
-    assert response.status_code == 401
-    response_data = json.loads(response.data)
-    assert response_data['success'] is False
-    assert 'Unauthorized' in response_data['error']
-
-
 def test_multiple_admins_isolation(client):
     """
     Comprehensive test to verify that multiple admins can only edit their own events
@@ -1541,11 +1331,10 @@ def test_multiple_admins_isolation(client):
     }
     
     response = client.post('/api/create_event',
-                          data=json.dumps(event_data_1),
-                          content_type='application/json')
+                          json=event_data_1)
     
     assert response.status_code == 201
-    event_id_1 = json.loads(response.data)['event_id']
+    event_id_1 = loads(response.data)['event_id']
     
     # Switch to Admin 2
     with client.session_transaction() as sess:
@@ -1562,11 +1351,10 @@ def test_multiple_admins_isolation(client):
     }
     
     response = client.post('/api/create_event',
-                          data=json.dumps(event_data_2),
-                          content_type='application/json')
+                          json=event_data_2)
     
     assert response.status_code == 201
-    event_id_2 = json.loads(response.data)['event_id']
+    event_id_2 = loads(response.data)['event_id']
     
     # Admin 2 can edit their own event
     update_data = {
@@ -1577,19 +1365,17 @@ def test_multiple_admins_isolation(client):
     }
     
     response = client.put(f'/api/events/{event_id_2}',
-                         data=json.dumps(update_data),
-                         content_type='application/json')
+                         json=update_data)
     
     assert response.status_code == 200
-    assert json.loads(response.data)['success'] is True
+    assert loads(response.data)['success'] is True
     
     # Admin 2 cannot edit Admin 1's event
     response = client.put(f'/api/events/{event_id_1}',
-                         data=json.dumps(update_data),
-                         content_type='application/json')
+                         json=update_data)
     
     assert response.status_code == 403
-    assert json.loads(response.data)['success'] is False
+    assert loads(response.data)['success'] is False
     
     # Switch back to Admin 1
     with client.session_transaction() as sess:
@@ -1605,73 +1391,27 @@ def test_multiple_admins_isolation(client):
     }
     
     response = client.put(f'/api/events/{event_id_1}',
-                         data=json.dumps(update_data_1),
-                         content_type='application/json')
+                         json=update_data_1)
     
     assert response.status_code == 200
-    assert json.loads(response.data)['success'] is True
+    assert loads(response.data)['success'] is True
     
     # Admin 1 cannot edit Admin 2's event
     response = client.put(f'/api/events/{event_id_2}',
-                         data=json.dumps(update_data_1),
-                         content_type='application/json')
+                         json=update_data_1)
     
     assert response.status_code == 403
-    assert json.loads(response.data)['success'] is False
+    assert loads(response.data)['success'] is False
     
     # Verify final state - both events have correct data
     response = client.get('/events')
-    events = json.loads(response.data)
+    events = _by_id(response)
     
-    event1 = next((e for e in events if e['id'] == event_id_1), None)
-    event2 = next((e for e in events if e['id'] == event_id_2), None)
+    event1 = events.get(event_id_1)
+    event2 = events.get(event_id_2)
     
     assert event1['name'] == 'Admin 1 Updated Event'
     assert event1['created_by_admin_id'] == 1
     
     assert event2['name'] == 'Admin 2 Updated Event'
     assert event2['created_by_admin_id'] == 2
-
-
-def test_authorization_with_missing_admin_id_in_session(client):
-    """
-    Test that requests with incomplete session data (missing admin_id) are rejected.
-    
-    Requirements: 6.1
-    """
-    # Create an event with complete session
-    event_data = {
-        'eventName': 'Test Event',
-        'eventLocation': 'Test Location',
-        'eventDate': '2024-12-25',
-        'eventCategory': 'Festival'
-    }
-    
-    response = client.post('/api/create_event',
-                          data=json.dumps(event_data),
-                          content_type='application/json')
-    
-    assert response.status_code == 201
-    event_id = json.loads(response.data)['event_id']
-    
-    # Corrupt session by removing admin_id but keeping admin_logged_in
-    with client.session_transaction() as sess:
-        sess['admin_logged_in'] = True
-        if 'admin_id' in sess:
-            del sess['admin_id']
-    
-    # Try to update event with corrupted session
-    update_data = {
-        'name': 'Updated Name',
-        'location': 'Updated Location',
-        'date': '2025-01-01',
-        'category': 'Corporate'
-    }
-    
-    response = client.put(f'/api/events/{event_id}',
-                         data=json.dumps(update_data),
-                         content_type='application/json')
-    
-    # Should fail due to missing admin_id (ownership check will fail)
-    # The endpoint will try to compare None with the event's admin_id
-    assert response.status_code in [401, 403, 500]  # Could be any of these depending on implementation
@@ -1,20 +1,62 @@
 """
 Test suite for event deletion functionality
+
+Safe to run under pytest-xdist: the events file and upload folders live in
+the worker's own temp dir. Use --dist=loadfile so the module's tests, which
+share one client, stay on a single worker:
+
+    pytest -n auto --dist=loadfile backend/test_event_deletion.py
 """
 import pytest
 import json
-import os
-import tempfile
 import shutil
+from pathlib import Path
+
+# Bind the module now: test_config.py re-imports app, and a later
+# "import app" would return a module that isn't serving this app's routes
+import app as app_module
 from app import app
+from testutils import loads
 
 
-@pytest.fixture
-def client():
-    """Create a test client"""
+@pytest.fixture(scope="module")
+def client(worker_tmp_dir):
+    """
+    Create one test client shared by every test in the module.
+    
+    The events file and upload folders are redirected to the xdist worker's
+    temp dir for the module; per-test isolation comes from ``_reset_state``.
+    """
     app.config['TESTING'] = True
-    with app.test_client() as client:
-        yield client
+    temp_dir = worker_tmp_dir / 'event_deletion'
+    temp_dir.mkdir()
+    events_path = temp_dir / 'events_data.json'
+    events_path.write_text('[]')
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(app_module, 'EVENTS_DATA_PATH', str(events_path))
+        mp.setitem(app.config, 'UPLOAD_FOLDER', str(temp_dir / 'uploads'))
+        mp.setitem(app.config, 'PROCESSED_FOLDER', str(temp_dir / 'processed'))
+        with app.test_client() as client:
+            yield client
+
+
+@pytest.fixture(autouse=True)
+def _reset_state(client):
+    """
+    Clear the shared client's session before each test, and roll back the
+    test's changes to the events file afterwards.
+    """
+    with client.session_transaction() as sess:
+        sess.clear()
+    
+    with open(app_module.EVENTS_DATA_PATH, 'rb') as f:
+        events_snapshot = f.read()
+    
+    yield
+    
+    with open(app_module.EVENTS_DATA_PATH, 'wb') as f:
+        f.write(events_snapshot)
 
 
 @pytest.fixture
@@ -28,12 +70,54 @@ def admin_session(client):
     return client
 
 
+def write_events(events):
+    """Replace the contents of the events file the app reads"""
+    with open(app_module.EVENTS_DATA_PATH, 'w') as f:
+        json.dump(events, f)
+
+
+def read_events():
+    """Return the events currently stored in the events file"""
+    with open(app_module.EVENTS_DATA_PATH, 'r') as f:
+        return json.load(f)
+
+
+# Contents of the events file; event_test123 belongs to admin 1
+MOCK_EVENTS = [
+    {
+        "id": "event_test123",
+        "name": "Test Event",
+        "location": "Test Location",
+        "date": "2024-12-15",
+        "category": "Festival",
+        "image": "/static/images/default_event.jpg",
+        "photos_count": 1,
+        "qr_code": "/api/qr_code/event_test123",
+        "created_by_admin_id": 1,
+        "created_by_user_id": None,
+        "created_at": "2024-12-01T10:00:00"
+    },
+    {
+        "id": "event_other456",
+        "name": "Other Event",
+        "location": "Other Location",
+        "date": "2024-12-20",
+        "category": "Corporate",
+        "image": "/static/images/default_event.jpg",
+        "photos_count": 0,
+        "qr_code": "/api/qr_code/event_other456",
+        "created_by_admin_id": 2,
+        "created_by_user_id": None,
+        "created_at": "2024-12-02T10:00:00"
+    }
+]
+
+
 @pytest.fixture
-def mock_event_data(tmp_path):
-    """Create mock event data"""
-    # Create temporary directories
-    upload_dir = tmp_path / "uploads" / "event_test123"
-    processed_dir = tmp_path / "processed" / "event_test123"
+def mock_event_data(client):
+    """Create mock event data in the client's upload and processed folders"""
+    upload_dir = Path(app.config['UPLOAD_FOLDER']) / "event_test123"
+    processed_dir = Path(app.config['PROCESSED_FOLDER']) / "event_test123"
     upload_dir.mkdir(parents=True)
     processed_dir.mkdir(parents=True)
     
@@ -43,42 +127,15 @@ def mock_event_data(tmp_path):
     (processed_dir / "person_0001" / "individual").mkdir()
     (processed_dir / "person_0001" / "individual" / "photo1.jpg").write_text("fake image")
     
-    # Create mock events data
-    events_data = [
-        {
-            "id": "event_test123",
-            "name": "Test Event",
-            "location": "Test Location",
-            "date": "2024-12-15",
-            "category": "Festival",
-            "image": "/static/images/default_event.jpg",
-            "photos_count": 1,
-            "qr_code": "/api/qr_code/event_test123",
-            "created_by_admin_id": 1,
-            "created_by_user_id": None,
-            "created_at": "2024-12-01T10:00:00"
-        },
-        {
-            "id": "event_other456",
-            "name": "Other Event",
-            "location": "Other Location",
-            "date": "2024-12-20",
-            "category": "Corporate",
-            "image": "/static/images/default_event.jpg",
-            "photos_count": 0,
-            "qr_code": "/api/qr_code/event_other456",
-            "created_by_admin_id": 2,
-            "created_by_user_id": None,
-            "created_at": "2024-12-02T10:00:00"
-        }
-    ]
-    
-    return {
-        'events_data': events_data,
+    yield {
+        'events_data': MOCK_EVENTS,
         'upload_dir': upload_dir,
-        'processed_dir': processed_dir,
-        'tmp_path': tmp_path
+        'processed_dir': processed_dir
     }
+    
+    # Tests that don't delete the event leave its folders behind
+    shutil.rmtree(upload_dir, ignore_errors=True)
+    shutil.rmtree(processed_dir, ignore_errors=True)
 
 
 class TestEventDeletion:
@@ -88,158 +145,75 @@ class TestEventDeletion:
         """Test that unauthenticated users cannot delete events"""
         response = client.delete('/api/delete_event/event_test123')
         assert response.status_code == 401
-        data = json.loads(response.data)
+        data = loads(response.data)
         assert data['success'] is False
         assert 'Unauthorized' in data['error']
     
-    def test_delete_event_not_found(self, admin_session, monkeypatch):
+    def test_delete_event_not_found(self, admin_session):
         """Test deleting a non-existent event"""
-        # Create temporary events file
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            json.dump([], f)
-            temp_file = f.name
+        write_events([])
         
-        # Import app module to patch the module-level variable
-        import app as app_module
-        original_path = app_module.EVENTS_DATA_PATH
-        app_module.EVENTS_DATA_PATH = temp_file
+        response = admin_session.delete('/api/delete_event/nonexistent_event')
         
-        try:
-            response = admin_session.delete('/api/delete_event/nonexistent_event')
-            
-            assert response.status_code == 404
-            data = json.loads(response.data)
-            assert data['success'] is False
-            assert 'not found' in data['error'].lower()
-        finally:
-            # Cleanup and restore
-            app_module.EVENTS_DATA_PATH = original_path
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
+        assert response.status_code == 404
+        data = loads(response.data)
+        assert data['success'] is False
+        assert 'not found' in data['error'].lower()
     
-    def test_delete_event_wrong_owner(self, admin_session, mock_event_data, monkeypatch):
+    def test_delete_event_wrong_owner(self, admin_session, mock_event_data):
         """Test that admin cannot delete another admin's event"""
-        # Create temporary events file
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            json.dump(mock_event_data['events_data'], f)
-            temp_file = f.name
+        write_events(mock_event_data['events_data'])
         
-        # Import app module to patch the module-level variable
-        import app as app_module
-        original_path = app_module.EVENTS_DATA_PATH
-        app_module.EVENTS_DATA_PATH = temp_file
+        # Try to delete event owned by admin_id=2 while logged in as admin_id=1
+        response = admin_session.delete('/api/delete_event/event_other456')
         
-        try:
-            # Verify file exists
-            assert os.path.exists(temp_file), f"Temp file should exist: {temp_file}"
-            
-            # Try to delete event owned by admin_id=2 while logged in as admin_id=1
-            response = admin_session.delete('/api/delete_event/event_other456')
-            
-            assert response.status_code == 403
-            data = json.loads(response.data)
-            assert data['success'] is False
-            assert 'only delete events you created' in data['error'].lower()
-        finally:
-            # Cleanup and restore
-            app_module.EVENTS_DATA_PATH = original_path
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
+        assert response.status_code == 403
+        data = loads(response.data)
+        assert data['success'] is False
+        assert 'only delete events you created' in data['error'].lower()
     
-    def test_delete_event_success(self, admin_session, mock_event_data, monkeypatch):
+    def test_delete_event_success(self, admin_session, mock_event_data):
         """Test successful event deletion"""
-        # Create temporary events file
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            json.dump(mock_event_data['events_data'], f)
-            temp_file = f.name
+        write_events(mock_event_data['events_data'])
+        
+        # Verify folders exist before deletion
+        assert mock_event_data['upload_dir'].exists()
+        assert mock_event_data['processed_dir'].exists()
         
-        # Import app module to patch the module-level variables
-        import app as app_module
-        original_events_path = app_module.EVENTS_DATA_PATH
-        original_upload_folder = app_module.UPLOAD_FOLDER
-        original_processed_folder = app_module.PROCESSED_FOLDER
+        # Delete the event
+        response = admin_session.delete('/api/delete_event/event_test123')
         
-        app_module.EVENTS_DATA_PATH = temp_file
-        app_module.UPLOAD_FOLDER = str(mock_event_data['tmp_path'] / 'uploads')
-        app_module.PROCESSED_FOLDER = str(mock_event_data['tmp_path'] / 'processed')
+        assert response.status_code == 200
+        data = loads(response.data)
+        assert data['success'] is True
+        assert 'deleted successfully' in data['message'].lower()
         
-        # Also patch app.config
-        admin_session.application.config['UPLOAD_FOLDER'] = str(mock_event_data['tmp_path'] / 'uploads')
-        admin_session.application.config['PROCESSED_FOLDER'] = str(mock_event_data['tmp_path'] / 'processed')
+        # Verify folders are deleted
+        assert not mock_event_data['upload_dir'].exists()
+        assert not mock_event_data['processed_dir'].exists()
         
-        try:
-            # Verify folders exist before deletion
-            assert mock_event_data['upload_dir'].exists()
-            assert mock_event_data['processed_dir'].exists()
-            
-            # Delete the event
-            response = admin_session.delete('/api/delete_event/event_test123')
-            
-            assert response.status_code == 200
-            data = json.loads(response.data)
-            assert data['success'] is True
-            assert 'deleted successfully' in data['message'].lower()
-            
-            # Verify folders are deleted
-            assert not mock_event_data['upload_dir'].exists()
-            assert not mock_event_data['processed_dir'].exists()
-            
-            # Verify event removed from events_data.json
-            with open(temp_file, 'r') as f:
-                remaining_events = json.load(f)
-            
-            assert len(remaining_events) == 1
-            assert remaining_events[0]['id'] == 'event_other456'
-        finally:
-            # Cleanup and restore
-            app_module.EVENTS_DATA_PATH = original_events_path
-            app_module.UPLOAD_FOLDER = original_upload_folder
-            app_module.PROCESSED_FOLDER = original_processed_folder
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
+        # Verify event removed from events_data.json
+        remaining_events = read_events()
+        assert len(remaining_events) == 1
+        assert remaining_events[0]['id'] == 'event_other456'
     
-    def test_delete_event_missing_folders(self, admin_session, mock_event_data, monkeypatch):
+    def test_delete_event_missing_folders(self, admin_session, mock_event_data, monkeypatch, tmp_path):
         """Test deletion when folders don't exist (should still succeed)"""
-        # Create temporary events file
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            json.dump(mock_event_data['events_data'], f)
-            temp_file = f.name
-        
-        # Import app module to patch the module-level variables
-        import app as app_module
-        original_events_path = app_module.EVENTS_DATA_PATH
-        original_upload_folder = app_module.UPLOAD_FOLDER
-        original_processed_folder = app_module.PROCESSED_FOLDER
+        write_events(mock_event_data['events_data'])
+        monkeypatch.setitem(app.config, 'UPLOAD_FOLDER', str(tmp_path / 'nonexistent_uploads'))
+        monkeypatch.setitem(app.config, 'PROCESSED_FOLDER', str(tmp_path / 'nonexistent_processed'))
         
-        app_module.EVENTS_DATA_PATH = temp_file
-        app_module.UPLOAD_FOLDER = str(mock_event_data['tmp_path'] / 'nonexistent_uploads')
-        app_module.PROCESSED_FOLDER = str(mock_event_data['tmp_path'] / 'nonexistent_processed')
+        # Delete the event
+        response = admin_session.delete('/api/delete_event/event_test123')
         
-        # Also patch app.config
-        admin_session.application.config['UPLOAD_FOLDER'] = str(mock_event_data['tmp_path'] / 'nonexistent_uploads')
-        admin_session.application.config['PROCESSED_FOLDER'] = str(mock_event_data['tmp_path'] / 'nonexistent_processed')
+        assert response.status_code == 200
+        data = loads(response.data)
+        assert data['success'] is True
         
-        try:
-            # Delete the event
-            response = admin_session.delete('/api/delete_event/event_test123')
-            
-            assert response.status_code == 200
-            data = json.loads(response.data)
-            assert data['success'] is True
-            
-            # Verify event removed from events_data.json
-            with open(temp_file, 'r') as f:
-                remaining_events = json.load(f)
-            
-            assert len(remaining_events) == 1
-            assert remaining_events[0]['id'] == 'event_other456'
-        finally:
-            # Cleanup and restore
-            app_module.EVENTS_DATA_PATH = original_events_path
-            app_module.UPLOAD_FOLDER = original_upload_folder
-            app_module.PROCESSED_FOLDER = original_processed_folder
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
+        # Verify event removed from events_data.json
+        remaining_events = read_events()
+        assert len(remaining_events) == 1
+        assert remaining_events[0]['id'] == 'event_other456'
 
 
 if __name__ == '__main__':
@@ -0,0 +1,98 @@
+"""
+Helpers shared by the backend test modules.
+
+Test modules import these directly. conftest.py is loaded by pytest as a
+plugin and holds only fixtures and hooks, so importing it from a test
+module would execute it a second time.
+"""
+
+import hashlib
+import importlib
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Faster decoder for response bodies when orjson is installed
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+
+def docker_image_tag(project_root):
+    """
+    Return a picme-test tag derived from every file in the Docker build
+    context (.dockerignore applied), so an unchanged tree reuses the cached
+    image and any change to what the Dockerfile copies does not.
+    """
+    from docker.utils.build import exclude_paths
+
+    dockerignore = os.path.join(project_root, '.dockerignore')
+    patterns = []
+    if os.path.exists(dockerignore):
+        with open(dockerignore) as f:
+            patterns = [line.strip() for line in f
+                        if line.strip() and not line.startswith('#')]
+
+    digest = hashlib.sha1()
+    for relative_path in sorted(exclude_paths(project_root, patterns)):
+        path = os.path.join(project_root, relative_path)
+        if not os.path.isfile(path):
+            continue
+        digest.update(relative_path.encode())
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+    return f"picme-test:{digest.hexdigest()[:12]}"
+
+
+def prune_test_images(docker_client, keep_tag):
+    """
+    Remove every picme-test image tag except ``keep_tag`` and
+    ``picme-test:latest``, so images built from earlier trees don't pile up
+    under their content-hash tags. Images a container still uses are kept.
+    """
+    from docker.errors import APIError
+
+    keep = {keep_tag, 'picme-test:latest'}
+    for image in docker_client.images.list(name='picme-test'):
+        for tag in image.tags:
+            if tag.startswith('picme-test:') and tag not in keep:
+                try:
+                    docker_client.images.remove(tag)
+                except APIError:
+                    pass
+
+
+def cached_import(module_name):
+    """
+    Return ``module_name`` from sys.modules, importing it only on first use.
+    """
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+    return module
+
+
+def ram_tmp_dir(prefix="picme-"):
+    """
+    mkdtemp() on tmpfs (/dev/shm) where there is one, so files the tests
+    write never reach the disk. Falls back to the default temp directory.
+    """
+    shm = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    return tempfile.mkdtemp(prefix=prefix, dir=shm)
+
+
+def database_url():
+    """
+    Return DATABASE_URL, skipping the calling test when it is unset or
+    still the placeholder from the example configuration.
+    """
+    url = os.environ.get("DATABASE_URL")
+    if not url:
+        pytest.skip("DATABASE_URL not set - skipping database test")
+    if "USER:PASSWORD@HOST/DBNAME" in url:
+        pytest.skip("DATABASE_URL is placeholder - skipping database test")
+    return url